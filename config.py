@@ -20,7 +20,10 @@ class ProviderConfig:
         return {
             'language': language or os.getenv('AZURE_SPEECH_LANGUAGE', 'en-US'),
             'audio_dir': os.getenv('AUDIO_DIR', './audio'),
-            'output_csv': os.getenv('OUTPUT_CSV', './transcriptions.csv')
+            'output_csv': os.getenv('OUTPUT_CSV', './transcriptions.csv'),
+            'cache_path': os.getenv('TRANSCRIPTION_CACHE'),
+            'cache_max_entries': int(os.getenv('TRANSCRIPTION_CACHE_MAX_ENTRIES', '100000')),
+            'max_retries': int(os.getenv('TRANSCRIPTION_MAX_RETRIES') or 3)
         }
 
 
@@ -33,7 +36,11 @@ class AzureConfig:
         return {
             'subscription_key': os.getenv('AZURE_SPEECH_KEY'),
             'region': os.getenv('AZURE_SPEECH_REGION', 'eastus'),
-            'endpoint': os.getenv('AZURE_SPEECH_ENDPOINT')
+            'endpoint': os.getenv('AZURE_SPEECH_ENDPOINT'),
+            'continuous': os.getenv('AZURE_CONTINUOUS', 'false').lower() in ('1', 'true', 'yes'),
+            'max_parallel_recognitions': int(os.getenv('AZURE_MAX_PARALLEL_RECOGNITIONS', '8')),
+            'warm_pool_size': int(os.getenv('AZURE_WARM_POOL_SIZE', '0')),
+            'requests_per_second': float(os.getenv('AZURE_REQUESTS_PER_SECOND') or 0) or None
         }
     
     @staticmethod
@@ -55,7 +62,12 @@ class AmazonConfig:
             'aws_access_key_id': os.getenv('AWS_ACCESS_KEY_ID'),
             'aws_secret_access_key': os.getenv('AWS_SECRET_ACCESS_KEY'),
             'region': os.getenv('AWS_REGION', 'us-east-1'),
-            'bucket_name': os.getenv('AWS_S3_BUCKET')
+            'bucket_name': os.getenv('AWS_S3_BUCKET'),
+            'upload_workers': int(os.getenv('AWS_UPLOAD_WORKERS', '8')),
+            'max_concurrent_jobs': int(os.getenv('AWS_MAX_CONCURRENT_JOBS', '100')),
+            'download_workers': int(os.getenv('AWS_DOWNLOAD_WORKERS', '8')),
+            'output_bucket_name': os.getenv('AWS_OUTPUT_BUCKET') or None,
+            'requests_per_second': float(os.getenv('AWS_REQUESTS_PER_SECOND') or 0) or None
         }
     
     @staticmethod
@@ -78,7 +90,12 @@ class GoogleConfig:
         return {
             'project_id': os.getenv('GOOGLE_CLOUD_PROJECT'),
             'location': os.getenv('GOOGLE_CLOUD_LOCATION', 'global'),
-            'credentials_file': os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+            'credentials_file': os.getenv('GOOGLE_APPLICATION_CREDENTIALS'),
+            'gcs_bucket': os.getenv('GOOGLE_GCS_BUCKET') or None,
+            'batch_size': int(os.getenv('GOOGLE_BATCH_SIZE', '15')),
+            'recognizer': os.getenv('GOOGLE_RECOGNIZER') or None,
+            'streaming': os.getenv('GOOGLE_STREAMING', 'false').lower() in ('1', 'true', 'yes'),
+            'requests_per_second': float(os.getenv('GOOGLE_REQUESTS_PER_SECOND') or 0) or None
         }
     
     @staticmethod
@@ -98,7 +115,11 @@ class CustomServiceConfig:
     def from_env() -> Dict[str, Optional[str]]:
         """Load Custom Service configuration from environment variables."""
         return {
-            'service_uri': os.getenv('CUSTOM_SERVICE_URI', 'http://0.0.0.0:8000')
+            'service_uri': os.getenv('CUSTOM_SERVICE_URI', 'http://0.0.0.0:8000'),
+            'pool_size': int(os.getenv('CUSTOM_SERVICE_POOL_SIZE', '10')),
+            'timeout': int(os.getenv('CUSTOM_SERVICE_TIMEOUT', '300')),
+            'max_batch_size': int(os.getenv('CUSTOM_SERVICE_MAX_BATCH_SIZE', '16')),
+            'requests_per_second': float(os.getenv('CUSTOM_SERVICE_REQUESTS_PER_SECOND') or 0) or None
         }
     
     @staticmethod
@@ -0,0 +1,306 @@
+"""
+ASR Evaluation
+Computes WER/CER of transcription results against reference transcripts.
+Per-row scores and aggregated reports are saved to CSV files.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import jiwer
+import numpy as np
+import pandas as pd
+import typer
+
+app = typer.Typer()
+
+# Per-row error counts added to the evaluation report
+COUNT_COLUMNS = [
+    'ref_words', 'hits', 'substitutions', 'deletions', 'insertions',
+    'ref_chars', 'char_errors'
+]
+
+
+def _alignment_counts(alignment: List) -> Tuple[int, int, int, int]:
+    """
+    Count hits, substitutions, deletions and insertions in a jiwer alignment.
+    
+    Args:
+        alignment: List of jiwer AlignmentChunk for one sentence pair
+    
+    Returns:
+        Tuple of (hits, substitutions, deletions, insertions)
+    """
+    hits = substitutions = deletions = insertions = 0
+    
+    for chunk in alignment:
+        if chunk.type == 'equal':
+            hits += chunk.ref_end_idx - chunk.ref_start_idx
+        elif chunk.type == 'substitute':
+            substitutions += chunk.ref_end_idx - chunk.ref_start_idx
+        elif chunk.type == 'delete':
+            deletions += chunk.ref_end_idx - chunk.ref_start_idx
+        else:
+            insertions += chunk.hyp_end_idx - chunk.hyp_start_idx
+    
+    return hits, substitutions, deletions, insertions
+
+
+def score_pairs(references: pd.Series, hypotheses: pd.Series) -> pd.DataFrame:
+    """
+    Compute word and character error counts for (reference, hypothesis) pairs.
+    
+    Identical pairs (same clip transcribed identically by several providers,
+    empty hypotheses from failed requests, ...) are scored once. All distinct
+    pairs are aligned in a single jiwer call per level.
+    
+    Args:
+        references: Reference transcripts
+        hypotheses: Hypothesis transcripts, aligned with references
+    
+    Returns:
+        DataFrame with COUNT_COLUMNS plus wer and cer, one row per input pair
+    """
+    pairs = pd.MultiIndex.from_arrays([
+        references.fillna('').astype(str).str.strip(),
+        hypotheses.fillna('').astype(str).str.strip()
+    ])
+    codes, unique_pairs = pairs.factorize()
+    unique_refs = list(unique_pairs.get_level_values(0))
+    unique_hyps = list(unique_pairs.get_level_values(1))
+    
+    counts = np.zeros((len(unique_pairs), len(COUNT_COLUMNS)), dtype=np.int64)
+    
+    # jiwer rejects empty references: every hypothesis word is an insertion
+    scored = [i for i, reference in enumerate(unique_refs) if reference]
+    for i, hypothesis in enumerate(unique_hyps):
+        if not unique_refs[i]:
+            counts[i, COUNT_COLUMNS.index('insertions')] = len(hypothesis.split())
+            counts[i, COUNT_COLUMNS.index('char_errors')] = len(hypothesis)
+    
+    if scored:
+        refs = [unique_refs[i] for i in scored]
+        hyps = [unique_hyps[i] for i in scored]
+        words = jiwer.process_words(refs, hyps)
+        chars = jiwer.process_characters(refs, hyps)
+        
+        for i, word_alignment, char_alignment in zip(scored, words.alignments, chars.alignments):
+            hits, substitutions, deletions, insertions = _alignment_counts(word_alignment)
+            char_hits, char_subs, char_dels, char_ins = _alignment_counts(char_alignment)
+            counts[i] = [
+                hits + substitutions + deletions, hits, substitutions, deletions, insertions,
+                char_hits + char_subs + char_dels, char_subs + char_dels + char_ins
+            ]
+    
+    # Map the distinct pairs back to every input row
+    scores = pd.DataFrame(counts[codes], columns=COUNT_COLUMNS, index=references.index)
+    return _add_rates(scores)
+
+
+def _add_rates(scores: pd.DataFrame) -> pd.DataFrame:
+    """Add WER and CER computed from error counts (NaN for empty references)."""
+    word_errors = scores['substitutions'] + scores['deletions'] + scores['insertions']
+    scores['wer'] = word_errors / scores['ref_words'].where(scores['ref_words'] > 0)
+    scores['cer'] = scores['char_errors'] / scores['ref_chars'].where(scores['ref_chars'] > 0)
+    return scores
+
+
+def summarize(evaluation: pd.DataFrame, group_by: List[str]) -> pd.DataFrame:
+    """
+    Aggregate per-row error counts into corpus-level WER/CER per group.
+    
+    Rates are computed from the summed counts, so longer references weigh
+    more than short ones (standard corpus WER).
+    
+    Args:
+        evaluation: Per-row evaluation with COUNT_COLUMNS
+        group_by: Columns to group by
+    
+    Returns:
+        DataFrame with one row per group
+    """
+    if group_by:
+        grouped = evaluation.groupby(group_by, dropna=False)
+        summary = grouped[COUNT_COLUMNS].sum()
+        summary.insert(0, 'files', grouped.size())
+        summary = summary.reset_index()
+    else:
+        summary = evaluation[COUNT_COLUMNS].sum().to_frame().T
+        summary.insert(0, 'files', len(evaluation))
+    
+    return _add_rates(summary)
+
+
+def load_evaluation_pairs(
+    hypotheses_csv: Path,
+    references_csv: Path,
+    on: List[str],
+    hyp_column: str,
+    ref_column: str,
+    exclude_failed: bool = False,
+    group_by: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Join transcription results with their reference transcripts.
+    
+    Args:
+        hypotheses_csv: Transcription results CSV
+        references_csv: Reference transcripts CSV
+        on: Columns identifying the reference (e.g. ['filename'] or ['audio'])
+        hyp_column: Hypothesis text column in hypotheses_csv
+        ref_column: Reference text column in references_csv
+        exclude_failed: Drop rows whose status is not 'success'
+        group_by: Report columns, read as text like the join columns so that
+            e.g. an SNR of 5 is not turned into 5.0 when some rows lack it
+    
+    Returns:
+        Transcription results with a 'reference' column
+    
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If a key has several references
+    """
+    key_types = {column: str for column in on + (group_by or [])}
+    hypotheses = pd.read_csv(hypotheses_csv, dtype=key_types)
+    references = pd.read_csv(references_csv, dtype=key_types)
+    
+    for name, df, columns in [
+        (hypotheses_csv, hypotheses, on + [hyp_column]),
+        (references_csv, references, on + [ref_column])
+    ]:
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise KeyError(
+                f"{name} has no column {', '.join(missing)}. "
+                f"Available columns: {list(df.columns)}"
+            )
+    
+    if exclude_failed and 'status' in hypotheses.columns:
+        hypotheses = hypotheses[hypotheses['status'] == 'success']
+    
+    references = references[on + [ref_column]].rename(columns={ref_column: 'reference'})
+    try:
+        merged = hypotheses.merge(
+            references, on=on, how='left', validate='many_to_one', indicator=True
+        )
+    except pd.errors.MergeError:
+        raise ValueError(f"{references_csv} has more than one reference for some {'/'.join(on)} values")
+    
+    # Empty reference texts are kept (scored as insertions); missing keys are not
+    unmatched = merged.pop('_merge') == 'left_only'
+    if unmatched.any():
+        typer.secho(
+            f"Warning: {unmatched.sum()} rows have no reference and are not evaluated",
+            fg=typer.colors.YELLOW
+        )
+        merged = merged[~unmatched]
+    
+    return merged.reset_index(drop=True)
+
+
+@app.command()
+def main(
+    hypotheses_csv: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="Transcription results CSV (ideally normalized with normalizar_texto.py)"
+    ),
+    references_csv: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="Reference transcripts CSV"
+    ),
+    output_csv: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Per-row evaluation CSV (default: {hypotheses}_evaluation.csv)"
+    ),
+    summary_csv: Optional[Path] = typer.Option(
+        None,
+        "--summary",
+        "-s",
+        help="Aggregated report CSV (default: {hypotheses}_summary.csv)"
+    ),
+    on: Optional[str] = typer.Option(
+        None,
+        "--on",
+        help="Comma-separated join columns (default: filename if the references have it, else audio)"
+    ),
+    hyp_column: str = typer.Option(
+        "text_normalized",
+        "--hyp-column",
+        help="Hypothesis text column"
+    ),
+    ref_column: str = typer.Option(
+        "text_normalized",
+        "--ref-column",
+        help="Reference text column"
+    ),
+    group_by: str = typer.Option(
+        "provider,noise,snr",
+        "--group-by",
+        "-g",
+        help="Comma-separated columns to aggregate by (missing ones are skipped)"
+    ),
+    exclude_failed: bool = typer.Option(
+        False,
+        "--exclude-failed",
+        help="Skip rows whose status is not 'success' instead of scoring them as empty"
+    )
+):
+    """
+    Compute WER/CER of transcriptions against reference transcripts.
+    
+    Rows are joined with the references on filename (or audio id), scored
+    per row (WER, CER, substitutions, deletions, insertions) and aggregated
+    by provider, noise and SNR.
+    """
+    output_file = output_csv or hypotheses_csv.with_name(f"{hypotheses_csv.stem}_evaluation.csv")
+    summary_file = summary_csv or hypotheses_csv.with_name(f"{hypotheses_csv.stem}_summary.csv")
+    
+    if on:
+        join_columns = [column.strip() for column in on.split(',') if column.strip()]
+    else:
+        reference_columns = pd.read_csv(references_csv, nrows=0).columns
+        join_columns = ['filename'] if 'filename' in reference_columns else ['audio']
+    
+    group_columns = [column.strip() for column in group_by.split(',') if column.strip()]
+    
+    try:
+        evaluation = load_evaluation_pairs(
+            hypotheses_csv, references_csv, join_columns, hyp_column, ref_column,
+            exclude_failed, group_columns
+        )
+    except (KeyError, ValueError) as e:
+        typer.secho(f"Error: {e.args[0]}", fg=typer.colors.RED, bold=True)
+        raise typer.Exit(1)
+    
+    typer.echo(f"Evaluating {len(evaluation)} rows joined on {', '.join(join_columns)}")
+    
+    scores = score_pairs(evaluation['reference'], evaluation[hyp_column])
+    evaluation = pd.concat([evaluation, scores], axis=1)
+    evaluation.to_csv(output_file, index=False)
+    
+    groups = [column for column in group_columns if column in evaluation.columns]
+    summary = summarize(evaluation, groups)
+    summary.to_csv(summary_file, index=False)
+    
+    # Show the overall result per provider
+    overview_groups = ['provider'] if 'provider' in evaluation.columns else []
+    overview = summarize(evaluation, overview_groups)
+    typer.echo("")
+    typer.echo(overview[overview_groups + ['files', 'wer', 'cer']].to_string(
+        index=False,
+        formatters={'wer': '{:.2%}'.format, 'cer': '{:.2%}'.format}
+    ))
+    
+    typer.secho(f"\n✓ Evaluation saved to: {output_file}", fg=typer.colors.GREEN, bold=True)
+    typer.secho(f"✓ Summary by {', '.join(groups) or 'corpus'} saved to: {summary_file}",
+                fg=typer.colors.GREEN, bold=True)
+
+
+if __name__ == "__main__":
+    app()
@@ -4,15 +4,67 @@ Script de normalización de texto para evaluación de sistemas ASR.
 Aplica reglas estrictas de normalización para cálculo de WER en español.
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, Optional
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import typer
 from num2words import num2words
 
 
+# Versión del pipeline de normalización; incrementarla al cambiar las reglas
+# de código para invalidar las cachés de normalización existentes
+NORMALIZATION_VERSION = 1
+
+# Expresiones regulares precompiladas del pipeline de normalización
+# Posiciones entre una letra y un número pegados (en cualquier orden)
+LETTER_DIGIT_BOUNDARY_RE = re.compile(r'(?<=[a-zA-Z])(?=\d)|(?<=\d)(?=[a-zA-Z])')
+# Secuencias de dígitos
+NUMBER_RE = re.compile(r'\b\d+\b')
+# Puntuación y guiones bajos (que \w considera caracteres de palabra)
+PUNCTUATION_RE = re.compile(r'[^\w\s]|_')
+# "uno" como artículo antes de unidades de almacenamiento
+UNO_ARTICLE_RE = re.compile(r'\buno (terabyte|gigabyte|megabyte)\b')
+# Espacios múltiples
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def _number_to_words(number_str: str) -> str:
+    """
+    Convierte una secuencia de dígitos a palabras en español.
+    
+    Los resultados se memorizan por cadena de dígitos, ya que los mismos
+    números se repiten constantemente en las transcripciones.
+    
+    Args:
+        number_str: Secuencia de dígitos.
+        
+    Returns:
+        Número en palabras.
+    """
+    # Si es una secuencia larga (más de 4 dígitos), tratar como código
+    # y convertir dígito por dígito
+    if len(number_str) > 4:
+        return ' '.join(_number_to_words(digit) for digit in number_str)
+    
+    # Números normales: convertir directamente
+    try:
+        number = int(number_str)
+        return num2words(number, lang='es')
+    except (ValueError, OverflowError):
+        return number_str
+
+
 class TextNormalizer:
     """
     Clase responsable de normalizar texto en español para evaluación ASR.
@@ -33,6 +85,71 @@ class TextNormalizer:
             custom_replacements: Diccionario de reemplazos personalizados.
         """
         self.custom_replacements = custom_replacements or self._get_default_replacements()
+        
+        # Compilar todas las reglas una sola vez en una única expresión regular
+        self._replacement_map = {
+            original.lower(): replacement
+            for original, replacement in self.custom_replacements.items()
+        }
+        self._replacement_pattern = self._compile_replacements(self._replacement_map)
+    
+    def ruleset_hash(self) -> str:
+        """
+        Retorna un hash que identifica las reglas de normalización.
+        
+        Combina la versión del pipeline, la clase del normalizador y los
+        reemplazos personalizados, de modo que una caché de normalización
+        solo reutiliza resultados producidos con las mismas reglas.
+        """
+        rules = json.dumps(
+            [NORMALIZATION_VERSION, type(self).__qualname__, sorted(self._replacement_map.items())],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(rules.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _compile_replacements(replacements: Dict[str, str]) -> Optional[re.Pattern]:
+        """
+        Compila las claves de reemplazo en una sola expresión regular.
+        
+        Las claves se insertan en un trie y la expresión se genera a partir
+        de él, de modo que los prefijos comunes se evalúan una sola vez y,
+        en cada posición, se prefiere la coincidencia más larga. El coste de
+        aplicar el diccionario crece con la longitud del texto y no con el
+        número de reglas.
+        
+        Args:
+            replacements: Diccionario de reemplazos con claves en minúsculas.
+            
+        Returns:
+            Expresión compilada, o None si no hay reglas.
+        """
+        if not replacements:
+            return None
+        
+        trie: Dict = {}
+        for original in replacements:
+            node = trie
+            for char in original:
+                node = node.setdefault(char, {})
+            node[''] = True  # Fin de una clave
+        
+        def to_regex(node: Dict) -> str:
+            branches = [
+                re.escape(char) + to_regex(child)
+                for char, child in sorted(node.items())
+                if char != ''
+            ]
+            if not branches:
+                return ''
+            
+            alternation = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if '' in node:
+                # La clave termina aquí, pero se intenta primero la más larga
+                return '(?:' + alternation + ')?'
+            return alternation
+        
+        return re.compile(r'\b' + to_regex(trie) + r'\b', flags=re.IGNORECASE)
     
     @staticmethod
     def _get_default_replacements() -> Dict[str, str]:
@@ -119,27 +236,25 @@ class TextNormalizer:
         Returns:
             Texto con letras y números separados por espacios.
         """
-        # Insertar espacio entre letra y número
-        text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', text)
-        
-        # Insertar espacio entre número y letra
-        text = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', text)
-        
-        return text
+        # Insertar espacio entre letra y número, y entre número y letra
+        return LETTER_DIGIT_BOUNDARY_RE.sub(' ', text)
     
     def _apply_custom_replacements(self, text: str) -> str:
         """
         Aplica reemplazos personalizados de dominio.
         
-        Los reemplazos se aplican con word boundaries para evitar
-        reemplazos parciales no deseados.
+        Todas las reglas se aplican en una sola pasada con word boundaries
+        para evitar reemplazos parciales no deseados. Si varias claves
+        coinciden en la misma posición se usa la más larga, y el texto
+        reemplazado no se vuelve a evaluar con otras reglas.
         """
-        for original, replacement in self.custom_replacements.items():
-            # Usar word boundary para reemplazos exactos
-            pattern = r'\b' + re.escape(original) + r'\b'
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        if self._replacement_pattern is None:
+            return text
         
-        return text
+        return self._replacement_pattern.sub(
+            lambda match: self._replacement_map[match.group(0).lower()],
+            text
+        )
     
     def _numbers_to_words(self, text: str) -> str:
         """
@@ -149,25 +264,8 @@ class TextNormalizer:
         - Números individuales (5 -> cinco)
         - Números largos (secuencias de más de 4 dígitos se tratan dígito por dígito)
         """
-        def convert_number(match):
-            number_str = match.group(0)
-            
-            # Si es una secuencia larga (más de 4 dígitos), tratar como código
-            # y convertir dígito por dígito
-            if len(number_str) > 4:
-                return ' '.join(num2words(int(digit), lang='es') for digit in number_str)
-            
-            # Números normales: convertir directamente
-            try:
-                number = int(number_str)
-                return num2words(number, lang='es')
-            except (ValueError, OverflowError):
-                return number_str
-        
         # Buscar secuencias de dígitos
-        text = re.sub(r'\b\d+\b', convert_number, text)
-        
-        return text
+        return NUMBER_RE.sub(lambda match: _number_to_words(match.group(0)), text)
     
     @staticmethod
     def _remove_punctuation(text: str) -> str:
@@ -177,11 +275,8 @@ class TextNormalizer:
         Mantiene solo letras, números (ya convertidos a palabras) y espacios.
         """
         # Eliminar todos los caracteres excepto letras, números y espacios
-        text = re.sub(r'[^\w\s]', ' ', text)
-        # Eliminar guiones bajos que quedan del \w
-        text = re.sub(r'_', ' ', text)
-        
-        return text
+        # (incluidos los guiones bajos, que \w considera letras)
+        return PUNCTUATION_RE.sub(' ', text)
     
     @staticmethod
     def _spanish_post_processing(text: str) -> str:
@@ -192,21 +287,98 @@ class TextNormalizer:
         Por ejemplo: "uno terabyte" -> "un terabyte"
         """
         # Convertir "uno" a "un" antes de sustantivos comunes
-        text = re.sub(r'\buno terabyte\b', 'un terabyte', text)
-        text = re.sub(r'\buno gigabyte\b', 'un gigabyte', text)
-        text = re.sub(r'\buno megabyte\b', 'un megabyte', text)
-        
-        return text
+        return UNO_ARTICLE_RE.sub(r'un \1', text)
     
     @staticmethod
     def _clean_whitespace(text: str) -> str:
         """Limpia espacios múltiples y espacios al inicio/final."""
-        # Reemplazar múltiples espacios por uno solo
-        text = re.sub(r'\s+', ' ', text)
-        # Eliminar espacios al inicio y final
-        text = text.strip()
+        # Reemplazar múltiples espacios por uno solo y eliminar espacios
+        # al inicio y final
+        return WHITESPACE_RE.sub(' ', text).strip()
+
+
+class _UniqueTexts(NamedTuple):
+    """Textos distintos de una columna y su estado de normalización."""
+    codes: np.ndarray
+    uniques: List
+    normalized: List[Optional[str]]
+    missing: List[int]
+
+
+class NormalizationCache:
+    """
+    Caché persistente de textos normalizados, almacenada en SQLite.
+    
+    Las entradas se indexan por (texto, hash de reglas), por lo que la
+    caché puede compartirse entre ejecuciones y entre normalizadores con
+    reglas distintas.
+    """
+    
+    # Máximo de parámetros por consulta (límite de SQLite)
+    BATCH_SIZE = 500
+    
+    def __init__(self, db_path: Path):
+        """
+        Abre (o crea) la base de datos de la caché.
         
-        return text
+        Args:
+            db_path: Ruta al archivo SQLite.
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS normalizations ("
+            "  ruleset TEXT NOT NULL,"
+            "  text TEXT NOT NULL,"
+            "  normalized TEXT NOT NULL,"
+            "  PRIMARY KEY (ruleset, text)"
+            ")"
+        )
+        self._conn.commit()
+    
+    def get_many(self, ruleset: str, texts: List) -> Dict[str, str]:
+        """
+        Busca varios textos en la caché.
+        
+        Args:
+            ruleset: Hash de reglas del normalizador.
+            texts: Textos a buscar (los valores que no son texto se ignoran).
+            
+        Returns:
+            Diccionario texto -> texto normalizado con los textos encontrados.
+        """
+        texts = [text for text in texts if isinstance(text, str)]
+        found = {}
+        
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = texts[start:start + self.BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self._conn.execute(
+                f"SELECT text, normalized FROM normalizations "
+                f"WHERE ruleset = ? AND text IN ({placeholders})",
+                [ruleset, *batch]
+            )
+            found.update(rows)
+        
+        return found
+    
+    def put_many(self, ruleset: str, items: List[Tuple[str, str]]) -> None:
+        """
+        Guarda varios textos normalizados.
+        
+        Args:
+            ruleset: Hash de reglas del normalizador.
+            items: Pares (texto, texto normalizado).
+        """
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO normalizations (ruleset, text, normalized) VALUES (?, ?, ?)",
+            [(ruleset, text, normalized) for text, normalized in items if isinstance(text, str)]
+        )
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Cierra la base de datos."""
+        self._conn.close()
 
 
 class CSVNormalizer:
@@ -216,50 +388,248 @@ class CSVNormalizer:
     Sigue el principio de Single Responsibility: solo maneja la lógica de CSV.
     """
     
-    def __init__(self, normalizer: TextNormalizer):
+    def __init__(
+        self,
+        normalizer: TextNormalizer,
+        cache: Optional[NormalizationCache] = None
+    ):
         """
         Inicializa el procesador de CSV.
         
         Args:
             normalizer: Instancia de TextNormalizer para normalizar texto.
+            cache: Caché persistente de normalización (opcional).
         """
         self.normalizer = normalizer
+        self.cache = cache
+        self.ruleset = normalizer.ruleset_hash()
+        self.unique_texts = 0
+        self.cache_hits = 0
     
     def process_csv(
         self,
         input_path: Path,
         output_path: Path,
-        text_column: str = "text"
-    ) -> None:
+        text_column: str = "text",
+        chunksize: Optional[int] = None,
+        workers: int = 1
+    ) -> int:
         """
         Procesa un archivo CSV normalizando la columna de texto especificada.
         
+        Con chunksize o workers > 1 el archivo se lee por bloques que se
+        escriben en orden a medida que terminan, de modo que la memoria usada
+        no depende del tamaño del archivo. Con workers > 1 los bloques se
+        normalizan en un pool de procesos.
+        
+        Cada texto distinto de un bloque (o del archivo completo) se
+        normaliza una sola vez, y si hay caché solo se normalizan los textos
+        que no se encuentran en ella.
+        
         Args:
             input_path: Ruta al archivo CSV de entrada.
             output_path: Ruta al archivo CSV de salida.
             text_column: Nombre de la columna a normalizar.
+            chunksize: Filas por bloque (por defecto se lee el archivo completo,
+                o bloques de 10000 filas si workers > 1).
+            workers: Número de procesos para normalizar (0 usa todos los núcleos).
+            
+        Returns:
+            Número de filas procesadas.
             
         Raises:
             FileNotFoundError: Si el archivo de entrada no existe.
             KeyError: Si la columna especificada no existe en el CSV.
         """
-        # Leer CSV
-        df = pd.read_csv(input_path)
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        
+        if chunksize is None and workers <= 1:
+            # Leer CSV
+            df = pd.read_csv(input_path)
+            self._check_column(df, text_column)
+            
+            # Normalizar la columna de texto
+            df[f"{text_column}_normalized"] = self._normalize_column(df[text_column])
+            
+            # Guardar CSV normalizado
+            df.to_csv(output_path, index=False)
+            return len(df)
+        
+        chunks = pd.read_csv(input_path, chunksize=chunksize or 10000)
+        rows = 0
+        first = True
+        
+        if workers <= 1:
+            for chunk in chunks:
+                self._check_column(chunk, text_column)
+                chunk[f"{text_column}_normalized"] = self._normalize_column(chunk[text_column])
+                self._write_chunk(chunk, output_path, first)
+                rows += len(chunk)
+                first = False
+        else:
+            rows, first = self._process_chunks_parallel(chunks, output_path, text_column, workers)
+        
+        if first:
+            # CSV sin filas: escribir solo el encabezado
+            empty = pd.read_csv(input_path, nrows=0)
+            self._check_column(empty, text_column)
+            empty[f"{text_column}_normalized"] = []
+            self._write_chunk(empty, output_path, first=True)
+        
+        return rows
+    
+    def _process_chunks_parallel(
+        self,
+        chunks: Iterator[pd.DataFrame],
+        output_path: Path,
+        text_column: str,
+        workers: int
+    ) -> Tuple[int, bool]:
+        """
+        Normaliza bloques en un pool de procesos y los escribe en orden.
+        
+        Solo se mantienen en vuelo hasta 2 * workers bloques a la vez.
+        
+        Returns:
+            Tupla (filas escritas, True si no se escribió ningún bloque).
+        """
+        rows = 0
+        first = True
+        
+        # Cada proceso recibe el normalizador una sola vez al arrancar
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.normalizer,)
+        ) as executor:
+            pending = deque()
+            
+            for chunk in chunks:
+                self._check_column(chunk, text_column)
+                
+                # Solo se envían al pool los textos distintos que no están en caché
+                unique = self._deduplicate(chunk[text_column])
+                texts = [unique.uniques[i] for i in unique.missing]
+                pending.append((chunk, unique, executor.submit(_normalize_texts, texts)))
+                
+                # Limitar los bloques en memoria escribiendo los más antiguos
+                while len(pending) >= workers * 2:
+                    rows += self._write_pending(pending, text_column, output_path, first)
+                    first = False
+            
+            while pending:
+                rows += self._write_pending(pending, text_column, output_path, first)
+                first = False
+        
+        return rows, first
+    
+    def _normalize_column(self, texts: pd.Series) -> np.ndarray:
+        """
+        Normaliza una columna, procesando cada texto distinto una sola vez.
+        
+        Args:
+            texts: Columna de textos.
+            
+        Returns:
+            Textos normalizados, en el mismo orden que la columna.
+        """
+        unique = self._deduplicate(texts)
+        normalized = [self.normalizer.normalize(unique.uniques[i]) for i in unique.missing]
+        return self._expand(unique, normalized)
+    
+    def _deduplicate(self, texts: pd.Series) -> _UniqueTexts:
+        """
+        Factoriza una columna en textos distintos y busca cada uno en la caché.
+        
+        Args:
+            texts: Columna de textos.
+            
+        Returns:
+            Códigos por fila, textos distintos, normalizaciones encontradas
+            en caché e índices de los textos que falta normalizar.
+        """
+        # Los valores nulos reciben el código -1
+        codes, uniques = pd.factorize(texts)
+        uniques = list(uniques)
+        normalized: List[Optional[str]] = [None] * len(uniques)
+        
+        if self.cache is not None:
+            cached = self.cache.get_many(self.ruleset, uniques)
+            for i, text in enumerate(uniques):
+                if isinstance(text, str) and text in cached:
+                    normalized[i] = cached[text]
+            self.cache_hits += len(cached)
+        
+        missing = [i for i, value in enumerate(normalized) if value is None]
+        self.unique_texts += len(uniques)
+        return _UniqueTexts(codes, uniques, normalized, missing)
+    
+    def _expand(self, unique: _UniqueTexts, normalized: List[str]) -> np.ndarray:
+        """
+        Completa las normalizaciones faltantes y las expande a todas las filas.
+        
+        Args:
+            unique: Resultado de _deduplicate.
+            normalized: Normalizaciones de los textos en unique.missing.
+            
+        Returns:
+            Textos normalizados, uno por fila.
+        """
+        for i, text in zip(unique.missing, normalized):
+            unique.normalized[i] = text
         
-        # Verificar que la columna existe
+        if self.cache is not None and unique.missing:
+            self.cache.put_many(
+                self.ruleset,
+                [(unique.uniques[i], unique.normalized[i]) for i in unique.missing]
+            )
+        
+        # El código -1 (valor nulo) toma el último elemento: texto vacío
+        values = np.asarray(unique.normalized + [""], dtype=object)
+        return values[unique.codes]
+    
+    def _write_pending(
+        self,
+        pending: deque,
+        text_column: str,
+        output_path: Path,
+        first: bool
+    ) -> int:
+        """Espera el bloque más antiguo, lo escribe y retorna sus filas."""
+        chunk, unique, future = pending.popleft()
+        chunk[f"{text_column}_normalized"] = self._expand(unique, future.result())
+        self._write_chunk(chunk, output_path, first)
+        return len(chunk)
+    
+    @staticmethod
+    def _write_chunk(chunk: pd.DataFrame, output_path: Path, first: bool) -> None:
+        """Escribe un bloque, con encabezado solo si es el primero."""
+        chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+    
+    @staticmethod
+    def _check_column(df: pd.DataFrame, text_column: str) -> None:
+        """Verifica que la columna existe."""
         if text_column not in df.columns:
             raise KeyError(
                 f"La columna '{text_column}' no existe en el CSV. "
                 f"Columnas disponibles: {list(df.columns)}"
             )
-        
-        # Normalizar la columna de texto
-        df[f"{text_column}_normalized"] = df[text_column].apply(
-            self.normalizer.normalize
-        )
-        
-        # Guardar CSV normalizado
-        df.to_csv(output_path, index=False)
+
+
+# Normalizador de cada proceso del pool
+_worker_normalizer: Optional[TextNormalizer] = None
+
+
+def _init_worker(normalizer: TextNormalizer) -> None:
+    """Guarda el normalizador en el proceso del pool."""
+    global _worker_normalizer
+    _worker_normalizer = normalizer
+
+
+def _normalize_texts(texts: List) -> List[str]:
+    """Normaliza una lista de textos en un proceso del pool."""
+    return [_worker_normalizer.normalize(text) for text in texts]
 
 
 # CLI con Typer
@@ -290,6 +660,24 @@ def normalizar(
         "-c",
         help="Nombre de la columna a normalizar.",
     ),
+    chunksize: Optional[int] = typer.Option(
+        None,
+        "--chunksize",
+        min=1,
+        help="Filas por bloque; procesa el archivo por partes con memoria acotada.",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=0,
+        help="Procesos para normalizar en paralelo (0 = todos los núcleos).",
+    ),
+    cache_path: Optional[Path] = typer.Option(
+        None,
+        "--cache",
+        help="Archivo SQLite para reutilizar normalizaciones entre ejecuciones.",
+    ),
 ) -> None:
     """
     Normaliza el texto de un archivo CSV para evaluación ASR.
@@ -311,6 +699,8 @@ def normalizar(
         $ python normalizar_texto.py google_clean.csv
     \n
         $ python normalizar_texto.py google_clean.csv -o google_normalized.csv
+    \n
+        $ python normalizar_texto.py resultados.csv --chunksize 50000 --workers 0
     """
     try:
         # Determinar ruta de salida
@@ -319,20 +709,31 @@ def normalizar(
         
         # Crear normalizador y procesador
         normalizer = TextNormalizer()
-        csv_processor = CSVNormalizer(normalizer)
+        cache = NormalizationCache(cache_path) if cache_path else None
+        csv_processor = CSVNormalizer(normalizer, cache)
         
         # Procesar archivo
         typer.echo(f"Procesando: {input_csv}")
-        csv_processor.process_csv(input_csv, output_csv, text_column)
+        try:
+            rows = csv_processor.process_csv(
+                input_csv, output_csv, text_column, chunksize=chunksize, workers=workers
+            )
+        finally:
+            if cache is not None:
+                cache.close()
         
         # Mostrar estadísticas
-        df = pd.read_csv(output_csv)
         typer.echo(f"Normalizacion completada exitosamente!")
-        typer.echo(f"Filas procesadas: {len(df)}")
+        typer.echo(f"Filas procesadas: {rows}")
+        typer.echo(
+            f"Textos normalizados: {csv_processor.unique_texts - csv_processor.cache_hits} "
+            f"distintos ({csv_processor.cache_hits} desde cache)"
+        )
         typer.echo(f"Archivo guardado en: {output_csv}")
         
-        # Mostrar ejemplo
-        if len(df) > 0:
+        # Mostrar ejemplo (solo se lee la primera fila del resultado)
+        if rows > 0:
+            df = pd.read_csv(output_csv, nrows=1)
             typer.echo("\nEjemplo de normalizacion:")
             typer.echo(f"  Original:    {df[text_column].iloc[0][:80]}...")
             typer.echo(f"  Normalizado: {df[f'{text_column}_normalized'].iloc[0][:80]}...")
@@ -1,10 +1,28 @@
 """Speech-to-Text Providers module."""
 
+import importlib
+
 from .base_provider import SpeechToTextProvider
-from .azure_provider import AzureSpeechToText
-from .amazon_provider import AmazonTranscribe
-from .custom_provider import CustomServiceProvider
-from .google_provider import GoogleSpeechToText
+from .multi_provider import transcribe_directory_multi
 from .provider_factory import ProviderFactory
+from .rate_limiter import RateLimiter
+from .registry import available_providers, get_config_class, register_provider
+from .transcription_cache import TranscriptionCache
+
+# Provider classes are imported on first access so that importing the
+# package does not load every cloud SDK
+_LAZY_PROVIDERS = {
+    'AzureSpeechToText': '.azure_provider',
+    'AmazonTranscribe': '.amazon_provider',
+    'CustomServiceProvider': '.custom_provider',
+    'GoogleSpeechToText': '.google_provider',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        return getattr(importlib.import_module(_LAZY_PROVIDERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['SpeechToTextProvider', 'AzureSpeechToText', 'AmazonTranscribe', 'CustomServiceProvider', 'GoogleSpeechToText', 'ProviderFactory']
+__all__ = ['SpeechToTextProvider', 'AzureSpeechToText', 'AmazonTranscribe', 'CustomServiceProvider', 'GoogleSpeechToText', 'ProviderFactory', 'RateLimiter', 'TranscriptionCache', 'transcribe_directory_multi', 'available_providers', 'get_config_class', 'register_provider']
@@ -3,11 +3,18 @@ Amazon Transcribe Speech-to-Text Service
 Handles speech-to-text transcription using AWS Transcribe.
 """
 
+import json
 import os
 import time
+import wave
 import boto3
-from typing import Dict, List
-from pathlib import Path
+import requests
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
 from .base_provider import SpeechToTextProvider
 
 
@@ -20,7 +27,11 @@ class AmazonTranscribe(SpeechToTextProvider):
         aws_secret_access_key: str,
         region: str = "us-east-1",
         language: str = "en-US",
-        bucket_name: str = None
+        bucket_name: str = None,
+        upload_workers: int = 8,
+        max_concurrent_jobs: int = 100,
+        download_workers: int = 8,
+        output_bucket_name: Optional[str] = None
     ):
         """
         Initialize Amazon Transcribe service.
@@ -31,6 +42,11 @@ class AmazonTranscribe(SpeechToTextProvider):
             region: AWS region (e.g., 'us-east-1', 'eu-west-1')
             language: Speech recognition language (default: 'en-US')
             bucket_name: S3 bucket name for temporary audio storage (required)
+            upload_workers: Number of parallel S3 uploads in batch mode (default: 8)
+            max_concurrent_jobs: Transcribe concurrent batch job quota (default: 100)
+            download_workers: Number of parallel transcript downloads (default: 8)
+            output_bucket_name: Optional S3 bucket where Transcribe writes transcripts;
+                if set, transcripts are read from S3 instead of presigned URLs
         """
         super().__init__()
         self.provider_name = "amazon"
@@ -45,6 +61,32 @@ class AmazonTranscribe(SpeechToTextProvider):
             )
         
         self.bucket_name = bucket_name
+        self.upload_workers = max(1, upload_workers)
+        
+        # Evaluation corpora are many small WAVs: upload them with a single PUT
+        # each and parallelize across files instead of within a file
+        self.transfer_config = TransferConfig(
+            multipart_threshold=32 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=4
+        )
+        
+        # Batch job submission and polling settings
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.min_poll_interval = 2  # seconds
+        self.max_poll_interval = 30  # seconds
+        self.max_wait_time = 600  # 10 minutes per job
+        self._seconds_per_audio_second = 1.0  # learned from completed jobs
+        
+        # Transcript retrieval: pooled keep-alive HTTPS session (certificates
+        # verified), or direct S3 reads when an output bucket is configured
+        self.download_workers = max(1, download_workers)
+        self.output_bucket_name = output_bucket_name
+        self.http_session = requests.Session()
+        self.http_session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.download_workers)
+        )
         
         # Initialize boto3 clients
         self.transcribe_client = boto3.client(
@@ -58,12 +100,44 @@ class AmazonTranscribe(SpeechToTextProvider):
             's3',
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
-            region_name=region
+            region_name=region,
+            config=Config(max_pool_connections=self.upload_workers + self.download_workers)
         )
         
         # Verify bucket exists and is accessible
         self._verify_bucket_access()
     
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], language: str = "en-US") -> 'AmazonTranscribe':
+        """
+        Create the provider from a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary from the provider config class
+            language: Recognition language (default: 'en-US')
+            
+        Returns:
+            AmazonTranscribe instance
+            
+        Raises:
+            ValueError: If required config is missing
+        """
+        if not config.get('aws_access_key_id') or not config.get('aws_secret_access_key'):
+            raise ValueError("aws_access_key_id and aws_secret_access_key are required for Amazon provider")
+        if not config.get('bucket_name'):
+            raise ValueError("bucket_name is required for Amazon provider")
+        return cls(
+            aws_access_key_id=config['aws_access_key_id'],
+            aws_secret_access_key=config['aws_secret_access_key'],
+            region=config.get('region', 'us-east-1'),
+            language=language,
+            bucket_name=config['bucket_name'],
+            upload_workers=config.get('upload_workers', 8),
+            max_concurrent_jobs=config.get('max_concurrent_jobs', 100),
+            download_workers=config.get('download_workers', 8),
+            output_bucket_name=config.get('output_bucket_name')
+        )
+    
     def _verify_bucket_access(self):
         """Verify S3 bucket exists and is accessible."""
         try:
@@ -113,11 +187,9 @@ class AmazonTranscribe(SpeechToTextProvider):
             print(f"Transcribing: {filename}")
             media_uri = f"s3://{self.bucket_name}/{s3_key}"
             
-            self.transcribe_client.start_transcription_job(
-                TranscriptionJobName=job_name,
-                Media={'MediaFileUri': media_uri},
-                MediaFormat=filename.split('.')[-1],
-                LanguageCode=self.language
+            self._rate_limited(
+                self.transcribe_client.start_transcription_job,
+                **self._transcription_job_args(job_name, media_uri, filename)
             )
             
             # Wait for job to complete (AWS Transcribe doesn't have built-in waiters)
@@ -132,7 +204,8 @@ class AmazonTranscribe(SpeechToTextProvider):
                 if elapsed > max_wait_time:
                     raise TimeoutError(f"Transcription job exceeded {max_wait_time} seconds")
                 
-                response = self.transcribe_client.get_transcription_job(
+                response = self._rate_limited(
+                    self.transcribe_client.get_transcription_job,
                     TranscriptionJobName=job_name
                 )
                 status = response['TranscriptionJob']['TranscriptionJobStatus']
@@ -160,22 +233,7 @@ class AmazonTranscribe(SpeechToTextProvider):
             
             # Get results
             if status == 'COMPLETED':
-                transcript_uri = response['TranscriptionJob']['Transcript']['TranscriptFileUri']
-                
-                # Download transcript using requests library (more reliable than urllib)
-                import json
-                import urllib.request
-                import ssl
-                
-                # Create SSL context that doesn't verify certificates (for development)
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                with urllib.request.urlopen(transcript_uri, context=ssl_context) as resp:
-                    transcript_data = json.loads(resp.read())
-                
-                text = transcript_data['results']['transcripts'][0]['transcript']
+                text = self._fetch_transcript(job_name, response['TranscriptionJob'])
                 
                 # Clean up job
                 self.transcribe_client.delete_transcription_job(TranscriptionJobName=job_name)
@@ -214,258 +272,473 @@ class AmazonTranscribe(SpeechToTextProvider):
                 "transcription_time": ""
             }
     
-    def transcribe_directory(
+    def transcribe_files(
         self,
-        audio_dir: str,
-        output_csv: str,
-        supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac')
-    ) -> None:
+        audio_files: Iterable[str],
+        concurrency: int = 1,
+        audio_dir: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
         """
-        Transcribe all audio files in a directory using batch processing.
+        Transcribe files using batch processing.
         Overrides base class to use parallel processing for better performance.
         
         Args:
-            audio_dir: Directory containing audio files
-            output_csv: Output CSV file path
-            supported_extensions: Tuple of supported audio file extensions
+            audio_files: Audio file paths
+            concurrency: Unused; batch jobs already run in parallel on AWS
+            audio_dir: Root directory; result filenames are made relative to it
+            
+        Yields:
+            Result dictionaries in input order
         """
-        audio_dir_path = Path(audio_dir)
-        
-        if not audio_dir_path.exists():
-            raise ValueError(f"Directory not found: {audio_dir}")
-        
-        # Find all audio files
-        audio_files = [
-            str(f) for f in audio_dir_path.iterdir()
-            if f.is_file() and f.suffix.lower() in supported_extensions
-        ]
-        
-        if not audio_files:
-            print(f"No audio files found in {audio_dir}")
-            return
-        
-        print(f"Found {len(audio_files)} audio files")
-        
-        # Use batch processing
-        results = self._batch_transcribe(audio_files)
-        
-        # Save to CSV
-        self._save_to_csv(results, output_csv)
-        print(f"\nResults saved to: {output_csv}")
+        audio_files = list(audio_files)
+        
+        # Serve cached transcriptions without uploading them again
+        cached_results = {}
+        if self.cache is not None:
+            for audio_file in audio_files:
+                key = self._cache_key(audio_file)
+                cached = self.cache.get(key) if key is not None else None
+                if cached is not None:
+                    cached_results[audio_file] = self._cached_result(audio_file, cached)
+            if cached_results:
+                print(f"Using {len(cached_results)} cached transcriptions")
+        
+        # Use batch processing for the rest
+        pending_files = [f for f in audio_files if f not in cached_results]
+        batch_results = iter(self._batch_transcribe(pending_files) if pending_files else [])
+        
+        # Merge cached and batch results in input order
+        for audio_file in audio_files:
+            result = cached_results.pop(audio_file, None) or next(batch_results)
+            self._finalize_result(result, audio_file, audio_dir)
+            yield result
     
-    def _batch_transcribe(self, audio_files: List[str]) -> List[Dict[str, str]]:
+    def _batch_transcribe(self, audio_files: List[str]) -> Iterator[Dict[str, str]]:
         """
-        Transcribe multiple audio files in batch using parallel job submission.
+        Transcribe multiple audio files as a pipeline of S3 uploads and AWS jobs.
+        
+        Each file moves through upload -> start job -> poll -> fetch transcript
+        independently: a job is started as soon as its upload finishes, and its
+        transcript is fetched and its S3 object deleted as soon as the job
+        completes, so upload time overlaps with Transcribe processing time.
+        No more than max_concurrent_jobs jobs are running at any time.
         
         Args:
             audio_files: List of audio file paths
             
-        Returns:
-            List of transcription results
+        Yields:
+            Transcription results in the same order as audio_files
         """
-        # Step 1: Upload all files to S3
-        jobs = self._upload_files_to_s3(audio_files)
-        
-        # Step 2: Start all transcription jobs
-        self._start_transcription_jobs(jobs)
-        
-        # Step 3: Wait for all jobs to complete
-        self._wait_for_jobs_completion(jobs)
+        run_id = int(time.time() * 1000)
+        jobs = self._prepare_jobs(audio_files, run_id)
+        job_prefix = f"transcribe-{run_id}-"
+        job_order = list(jobs)
+        finished_results = {}
+        next_index = 0
+        ready_jobs = deque()
+        submitted_jobs = {}
+        total_jobs = len(jobs)
+        completed_count = 0
+        next_poll = 0.0
         
-        # Step 4: Process results and cleanup
-        results = self._process_results_and_cleanup(jobs)
+        print("\n📤 Uploading files to S3 and starting transcription jobs...")
         
-        return results
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as upload_executor, \
+                ThreadPoolExecutor(max_workers=self.download_workers) as download_executor:
+            uploads = self._upload_files_to_s3(jobs, upload_executor)
+            collecting = {}
+            
+            def collect(job_name: str) -> None:
+                """Fetch a finished job's transcript and clean it up in the background."""
+                future = download_executor.submit(self._collect_job_result, job_name, jobs[job_name])
+                collecting[future] = job_name
+            
+            while uploads or ready_jobs or submitted_jobs or collecting:
+                # Queue every upload that has finished for submission
+                for future in [f for f in uploads if f.done()]:
+                    job_name = uploads.pop(future)
+                    if jobs[job_name]['status'] == 'uploaded':
+                        ready_jobs.append(job_name)
+                    else:
+                        collect(job_name)
+                
+                # Start queued jobs without exceeding the concurrent job quota
+                while ready_jobs and len(submitted_jobs) < self.max_concurrent_jobs:
+                    job_name = ready_jobs.popleft()
+                    job_info = jobs[job_name]
+                    self._start_transcription_job(job_name, job_info)
+                    
+                    if job_info['status'] == 'submitted':
+                        submitted_jobs[job_name] = job_info
+                        next_poll = min(next_poll or float('inf'), self._next_poll_time(job_info))
+                    else:
+                        collect(job_name)
+                
+                # Poll pending jobs and collect the ones that finished
+                if submitted_jobs and time.time() >= next_poll:
+                    for job_name in self._poll_transcription_jobs(submitted_jobs, job_prefix):
+                        job_info = submitted_jobs.pop(job_name)
+                        collect(job_name)
+                        
+                        completed_count += 1
+                        print(f"  ✓ Completed {completed_count}/{total_jobs}: {job_info['filename']}")
+                    
+                    next_poll = min(
+                        (self._next_poll_time(job_info) for job_info in submitted_jobs.values()),
+                        default=0.0
+                    )
+                
+                # Gather transcripts that have been downloaded
+                for future in [f for f in collecting if f.done()]:
+                    finished_results[collecting.pop(future)] = future.result()
+                
+                # Hand back results in input order as soon as they are available
+                while next_index < len(job_order) and job_order[next_index] in finished_results:
+                    yield finished_results.pop(job_order[next_index])
+                    next_index += 1
+                
+                delay = max(0.0, next_poll - time.time()) if submitted_jobs else self.max_poll_interval
+                if uploads or collecting:
+                    wait(list(uploads) + list(collecting), timeout=delay, return_when=FIRST_COMPLETED)
+                elif submitted_jobs:
+                    time.sleep(delay)
+        
+        while next_index < len(job_order):
+            yield finished_results.pop(job_order[next_index])
+            next_index += 1
     
-    def _upload_files_to_s3(self, audio_files: List[str]) -> Dict:
+    def _prepare_jobs(self, audio_files: List[str], run_id: int) -> Dict:
         """
-        Upload audio files to S3 bucket.
+        Assign a unique job name and S3 key to every audio file.
+        
+        Names combine a per-run timestamp with the file's position in the
+        batch, so they are unique without waiting between files.
         
         Args:
             audio_files: List of audio file paths
+            run_id: Identifier shared by all jobs of this batch
             
         Returns:
-            Dictionary mapping job names to file info
+            Dictionary mapping job names to file info, in input order
         """
-        print("\n📤 Uploading files to S3...")
         jobs = {}
         
-        for audio_file_path in sorted(audio_files, key=self._natural_sort_key):
+        for index, audio_file_path in enumerate(audio_files):
             filename = os.path.basename(audio_file_path)
             sanitized_name = filename.replace('.', '-').replace(' ', '_')
-            job_name = f"transcribe-{int(time.time() * 1000)}-{sanitized_name}"
-            s3_key = f"audio/{filename}"
+            # AWS Transcribe job names are limited to 200 characters
+            job_name = f"transcribe-{run_id}-{index:06d}-{sanitized_name}"[:200]
             
-            try:
-                print(f"  Uploading: {filename}")
-                self.s3_client.upload_file(audio_file_path, self.bucket_name, s3_key)
-                
-                jobs[job_name] = {
-                    'filename': filename,
-                    's3_key': s3_key,
-                    'audio_file_path': audio_file_path,
-                    'status': 'uploaded'
-                }
-                
-                time.sleep(0.01)  # Ensure unique timestamps
-                
-            except Exception as e:
-                jobs[job_name] = {
-                    'filename': filename,
-                    's3_key': s3_key,
-                    'audio_file_path': audio_file_path,
-                    'status': 'upload_failed',
-                    'error': str(e)
-                }
+            jobs[job_name] = {
+                'filename': filename,
+                's3_key': f"audio/{run_id}/{index:06d}-{filename}",
+                'audio_file_path': audio_file_path,
+                'status': 'pending',
+                'duration': None
+            }
         
         return jobs
     
-    def _start_transcription_jobs(self, jobs: Dict) -> None:
+    def _upload_files_to_s3(self, jobs: Dict, executor: ThreadPoolExecutor) -> Dict[Future, str]:
         """
-        Start AWS Transcribe jobs for all uploaded files.
+        Schedule the upload of every job's audio file to S3 in parallel.
         
         Args:
-            jobs: Dictionary mapping job names to file info (modified in place)
+            jobs: Dictionary mapping job names to file info
+            executor: Executor that runs the uploads
+            
+        Returns:
+            Dictionary mapping upload futures to job names
+        """
+        return {
+            executor.submit(self._upload_file, job_name, job_info): job_name
+            for job_name, job_info in jobs.items()
+        }
+    
+    def _upload_file(self, job_name: str, job_info: Dict) -> None:
         """
-        print("\n🚀 Starting transcription jobs...")
+        Upload a single audio file to S3.
         
-        for job_name, job_info in jobs.items():
-            if job_info['status'] != 'uploaded':
-                continue
-            
-            try:
-                filename = job_info['filename']
-                s3_key = job_info['s3_key']
-                media_uri = f"s3://{self.bucket_name}/{s3_key}"
-                
-                self.transcribe_client.start_transcription_job(
-                    TranscriptionJobName=job_name,
-                    Media={'MediaFileUri': media_uri},
-                    MediaFormat=filename.split('.')[-1],
-                    LanguageCode=self.language
-                )
-                
-                jobs[job_name]['status'] = 'submitted'
-                print(f"  Started: {filename}")
-                
-            except Exception as e:
-                jobs[job_name]['status'] = 'submit_failed'
-                jobs[job_name]['error'] = str(e)
-                print(f"  Failed to start: {filename} - {e}")
+        Args:
+            job_name: AWS Transcribe job name
+            job_info: Job information dictionary (modified in place)
+        """
+        try:
+            print(f"  Uploading: {job_info['filename']}")
+            job_info['duration'] = self._estimate_audio_duration(job_info['audio_file_path'])
+            self.s3_client.upload_file(
+                job_info['audio_file_path'],
+                self.bucket_name,
+                job_info['s3_key'],
+                Config=self.transfer_config
+            )
+            job_info['status'] = 'uploaded'
+        except Exception as e:
+            job_info['status'] = 'upload_failed'
+            job_info['error'] = str(e)
     
-    def _wait_for_jobs_completion(self, jobs: Dict) -> None:
+    def _start_transcription_job(self, job_name: str, job_info: Dict) -> None:
         """
-        Poll AWS Transcribe jobs until all are completed or failed.
+        Start the AWS Transcribe job for an uploaded file.
         
         Args:
-            jobs: Dictionary mapping job names to file info (modified in place)
+            job_name: AWS Transcribe job name
+            job_info: Job information dictionary (modified in place)
         """
-        print("\n⏳ Waiting for all transcriptions to complete...")
+        filename = job_info['filename']
         
-        submitted_jobs = {k: v for k, v in jobs.items() if v['status'] == 'submitted'}
-        max_wait_time = 600  # 10 minutes
-        start_time = time.time()
-        poll_interval = 5
-        completed_count = 0
-        total_jobs = len(submitted_jobs)
+        try:
+            media_uri = f"s3://{self.bucket_name}/{job_info['s3_key']}"
+            
+            self._rate_limited(
+                self.transcribe_client.start_transcription_job,
+                **self._transcription_job_args(job_name, media_uri, filename)
+            )
+            
+            job_info['status'] = 'submitted'
+            job_info['submitted_at'] = time.time()
+            print(f"  Started: {filename}")
+            
+        except Exception as e:
+            job_info['status'] = 'submit_failed'
+            job_info['error'] = str(e)
+            print(f"  Failed to start: {filename} - {e}")
+    
+    def _poll_transcription_jobs(self, submitted_jobs: Dict, job_prefix: str) -> List[str]:
+        """
+        Find which submitted jobs have finished.
+        
+        Uses list_transcription_jobs filtered by status and by the batch's job
+        name prefix, so a single call reports up to 100 finished jobs instead
+        of one get_transcription_job call per pending job. The full job
+        description is only fetched for completed jobs.
         
-        while submitted_jobs:
-            if time.time() - start_time > max_wait_time:
-                print(f"  ⚠️  Timeout reached, {len(submitted_jobs)} jobs still pending")
-                break
+        Args:
+            submitted_jobs: Dictionary mapping job names to file info
+                (job info is updated in place)
+            job_prefix: Job name prefix shared by all jobs of this batch
             
-            jobs_to_remove = []
+        Returns:
+            Names of jobs that finished (completed, failed or errored)
+        """
+        finished = []
+        
+        for status in ['COMPLETED', 'FAILED']:
+            try:
+                summaries = self._list_transcription_jobs(status, job_prefix)
+            except Exception as e:
+                print(f"  ⚠️  Could not list {status.lower()} jobs: {e}")
+                continue
             
-            for job_name, job_info in submitted_jobs.items():
+            for summary in summaries:
+                job_name = summary['TranscriptionJobName']
+                job_info = submitted_jobs.get(job_name)
+                if job_info is None or job_name in finished:
+                    continue
+                
                 try:
-                    response = self.transcribe_client.get_transcription_job(
-                        TranscriptionJobName=job_name
-                    )
-                    
-                    # Verify response matches requested job
-                    response_job_name = response['TranscriptionJob']['TranscriptionJobName']
-                    if response_job_name != job_name:
-                        raise ValueError(
-                            f"Job name mismatch: requested '{job_name}', got '{response_job_name}'"
+                    if status == 'COMPLETED' and not self.output_bucket_name:
+                        # The presigned transcript URI is only in the full description
+                        response = self._rate_limited(
+                            self.transcribe_client.get_transcription_job,
+                            TranscriptionJobName=job_name
                         )
+                    else:
+                        response = {'TranscriptionJob': summary}
                     
-                    status = response['TranscriptionJob']['TranscriptionJobStatus']
-                    
-                    if status in ['COMPLETED', 'FAILED']:
-                        jobs[job_name]['response'] = response
-                        jobs[job_name]['status'] = status.lower()
-                        jobs_to_remove.append(job_name)
-                        
-                        completed_count += 1
-                        print(f"  ✓ Completed {completed_count}/{total_jobs}: {job_info['filename']}")
-                        
+                    job_info['response'] = response
+                    job_info['status'] = status.lower()
+                    self._record_job_duration(job_info, response['TranscriptionJob'])
                 except Exception as e:
-                    jobs[job_name]['status'] = 'check_failed'
-                    jobs[job_name]['error'] = str(e)
-                    jobs_to_remove.append(job_name)
+                    job_info['status'] = 'check_failed'
+                    job_info['error'] = str(e)
+                
+                finished.append(job_name)
+        
+        # Give up on jobs that have been running for too long
+        for job_name, job_info in submitted_jobs.items():
+            if job_name not in finished and time.time() - job_info['submitted_at'] > self.max_wait_time:
+                job_info['status'] = 'timeout'
+                job_info['error'] = f"Transcription job exceeded {self.max_wait_time} seconds"
+                finished.append(job_name)
+        
+        return finished
+    
+    def _list_transcription_jobs(self, status: str, job_prefix: str) -> List[Dict]:
+        """
+        List all transcription job summaries with a status and name prefix.
+        
+        Args:
+            status: Job status filter ('COMPLETED', 'FAILED', ...)
+            job_prefix: Job name prefix to match
             
-            for job_name in jobs_to_remove:
-                del submitted_jobs[job_name]
+        Returns:
+            List of job summaries
+        """
+        summaries = []
+        kwargs = {'Status': status, 'JobNameContains': job_prefix, 'MaxResults': 100}
+        
+        while True:
+            response = self._rate_limited(self.transcribe_client.list_transcription_jobs, **kwargs)
+            summaries.extend(response.get('TranscriptionJobSummaries', []))
             
-            if submitted_jobs:
-                time.sleep(poll_interval)
+            next_token = response.get('NextToken')
+            if not next_token:
+                return summaries
+            kwargs['NextToken'] = next_token
     
-    def _process_results_and_cleanup(self, jobs: Dict) -> List[Dict[str, str]]:
+    def _next_poll_time(self, job_info: Dict) -> float:
         """
-        Process transcription results and cleanup S3 files.
+        Predict when a submitted job is worth polling for.
+        
+        The expected processing time is the audio duration scaled by the
+        processing-time-per-audio-second observed on completed jobs, clamped
+        between min_poll_interval and max_poll_interval.
         
         Args:
-            jobs: Dictionary mapping job names to file info
+            job_info: Job information dictionary
             
         Returns:
-            List of transcription results
+            Timestamp of the next useful status check
+        """
+        duration = job_info.get('duration') or 1.0
+        expected = duration * self._seconds_per_audio_second
+        elapsed = time.time() - job_info['submitted_at']
+        delay = min(self.max_poll_interval, max(self.min_poll_interval, expected - elapsed))
+        return time.time() + delay
+    
+    def _record_job_duration(self, job_info: Dict, job_data: Dict) -> None:
+        """
+        Update the processing-time estimate from a finished job's AWS timings.
+        
+        Args:
+            job_info: Job information dictionary
+            job_data: TranscriptionJob description or summary
+        """
+        creation_time = job_data.get('CreationTime')
+        completion_time = job_data.get('CompletionTime')
+        if not creation_time or not completion_time:
+            return
+        
+        processing = (completion_time - creation_time).total_seconds()
+        ratio = processing / max(job_info.get('duration') or 1.0, 1.0)
+        # Exponential moving average so the estimate follows the current load
+        self._seconds_per_audio_second = 0.8 * self._seconds_per_audio_second + 0.2 * ratio
+    
+    @staticmethod
+    def _estimate_audio_duration(audio_file_path: str) -> float:
         """
-        import json
-        import urllib.request
-        import ssl
+        Estimate the duration of an audio file in seconds.
         
-        print("\n📥 Processing results...")
-        results = []
-        s3_keys_to_delete = []
+        WAV durations are read from the header; other formats are estimated
+        from their size assuming 16 kHz, 16-bit mono audio.
         
-        # Create SSL context for downloading transcripts
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        Args:
+            audio_file_path: Path to the audio file
+            
+        Returns:
+            Duration in seconds
+        """
+        try:
+            with wave.open(audio_file_path, 'rb') as wav_file:
+                return wav_file.getnframes() / float(wav_file.getframerate())
+        except (wave.Error, EOFError, OSError):
+            return os.path.getsize(audio_file_path) / 32000.0
+    
+    def _transcription_job_args(self, job_name: str, media_uri: str, filename: str) -> Dict:
+        """
+        Build the start_transcription_job arguments for a file.
         
-        for job_name, job_info in jobs.items():
-            filename = job_info['filename']
-            s3_key = job_info['s3_key']
-            s3_keys_to_delete.append({'Key': s3_key})
+        Args:
+            job_name: AWS Transcribe job name
+            media_uri: S3 URI of the uploaded audio
+            filename: Audio filename
             
-            result = self._process_single_job_result(job_info, job_name, ssl_context)
+        Returns:
+            Keyword arguments for start_transcription_job
+        """
+        args = {
+            'TranscriptionJobName': job_name,
+            'Media': {'MediaFileUri': media_uri},
+            'MediaFormat': filename.split('.')[-1],
+            'LanguageCode': self.language
+        }
+        
+        if self.output_bucket_name:
+            args['OutputBucketName'] = self.output_bucket_name
+            args['OutputKey'] = self._transcript_key(job_name)
+        
+        return args
+    
+    @staticmethod
+    def _transcript_key(job_name: str) -> str:
+        """Return the output bucket key of a job's transcript."""
+        return f"transcripts/{job_name}.json"
+    
+    def _fetch_transcript(self, job_name: str, job_data: Dict) -> str:
+        """
+        Retrieve the transcript text of a completed job.
+        
+        Reads (and then deletes) the transcript from the output bucket when
+        one is configured; otherwise downloads it from the presigned URI
+        through the pooled HTTPS session.
+        
+        Args:
+            job_name: AWS Transcribe job name
+            job_data: TranscriptionJob description
             
-            # Add provider name and metadata
-            result['provider'] = self.provider_name
-            self._add_filename_metadata(result, filename)
+        Returns:
+            Transcript text
+        """
+        if self.output_bucket_name:
+            key = self._transcript_key(job_name)
+            response = self.s3_client.get_object(Bucket=self.output_bucket_name, Key=key)
+            transcript_data = json.loads(response['Body'].read())
+            self.s3_client.delete_object(Bucket=self.output_bucket_name, Key=key)
+        else:
+            response = self.http_session.get(job_data['Transcript']['TranscriptFileUri'], timeout=60)
+            response.raise_for_status()
+            transcript_data = response.json()
+        
+        return transcript_data['results']['transcripts'][0]['transcript']
+    
+    def _collect_job_result(self, job_name: str, job_info: Dict) -> Dict[str, str]:
+        """
+        Build the result for a finished job and delete its S3 object.
+        
+        Args:
+            job_name: AWS Transcribe job name
+            job_info: Job information dictionary
             
-            results.append(result)
+        Returns:
+            Result dictionary with filename, text, status, and transcription_time
+        """
+        result = self._process_single_job_result(job_info, job_name)
+        
+        if job_info['status'] != 'upload_failed':
+            try:
+                self.s3_client.delete_object(Bucket=self.bucket_name, Key=job_info['s3_key'])
+            except Exception as e:
+                print(f"⚠️  Warning: could not delete s3://{self.bucket_name}/{job_info['s3_key']}: {e}")
         
-        # Batch delete all S3 files
-        self._cleanup_s3_files(s3_keys_to_delete)
+        if self.cache is not None and result['status'] == 'success':
+            key = self._cache_key(job_info['audio_file_path'])
+            if key is not None:
+                self.cache.put(key, result)
         
-        return results
+        return result
     
-    def _process_single_job_result(self, job_info: Dict, job_name: str, ssl_context) -> Dict[str, str]:
+    def _process_single_job_result(self, job_info: Dict, job_name: str) -> Dict[str, str]:
         """
         Process result for a single transcription job.
         
         Args:
             job_info: Job information dictionary
             job_name: AWS Transcribe job name
-            ssl_context: SSL context for downloading transcripts
             
         Returns:
             Result dictionary with filename, text, status, and transcription_time
         """
-        import json
-        import urllib.request
-        
         filename = job_info['filename']
         
         try:
@@ -482,11 +755,7 @@ class AmazonTranscribe(SpeechToTextProvider):
                     aws_duration = (completion_time - creation_time).total_seconds()
                 
                 # Download and parse transcript
-                transcript_uri = job_data['Transcript']['TranscriptFileUri']
-                with urllib.request.urlopen(transcript_uri, context=ssl_context) as resp:
-                    transcript_data = json.loads(resp.read())
-                
-                text = transcript_data['results']['transcripts'][0]['transcript']
+                text = self._fetch_transcript(job_name, job_data)
                 
                 # Clean up job
                 self.transcribe_client.delete_transcription_job(TranscriptionJobName=job_name)
@@ -512,7 +781,15 @@ class AmazonTranscribe(SpeechToTextProvider):
                     "transcription_time": ""
                 }
             else:
-                # Upload failed, submit failed, or other error
+                if job_info['status'] in ('timeout', 'check_failed'):
+                    # The job may still be running; delete it before its media
+                    # is removed so it does not linger under the batch prefix
+                    try:
+                        self.transcribe_client.delete_transcription_job(TranscriptionJobName=job_name)
+                    except Exception as e:
+                        print(f"⚠️  Warning: could not delete transcription job {job_name}: {e}")
+                
+                # Upload failed, submit failed, timeout, or other error
                 error_msg = job_info.get('error', job_info['status'])
                 return {
                     "filename": filename,
@@ -528,44 +805,3 @@ class AmazonTranscribe(SpeechToTextProvider):
                 "status": f"exception: {str(e)}",
                 "transcription_time": ""
             }
-    
-    def _add_filename_metadata(self, result: Dict, filename: str) -> None:
-        """
-        Extract and add metadata from filename to result dictionary.
-        Expected format: {person}_{audio}_{noise}_{snr}.ext
-        
-        Args:
-            result: Result dictionary (modified in place)
-            filename: Audio filename
-        """
-        filename_stem = Path(filename).stem
-        parts = filename_stem.split('_')
-        
-        if len(parts) > 0: result['person'] = parts[0]
-        if len(parts) > 1: result['audio'] = parts[1]
-        if len(parts) > 2: result['noise'] = parts[2]
-        if len(parts) > 3: result['snr'] = parts[3]
-    
-    def _cleanup_s3_files(self, s3_keys_to_delete: List[Dict]) -> None:
-        """
-        Delete files from S3 bucket in batch.
-        
-        Args:
-            s3_keys_to_delete: List of S3 keys to delete
-        """
-        if not s3_keys_to_delete:
-            return
-        
-        print(f"\n🗑️  Deleting {len(s3_keys_to_delete)} files from S3...")
-        
-        try:
-            # S3 delete_objects can handle up to 1000 objects per call
-            for i in range(0, len(s3_keys_to_delete), 1000):
-                batch = s3_keys_to_delete[i:i+1000]
-                self.s3_client.delete_objects(
-                    Bucket=self.bucket_name,
-                    Delete={'Objects': batch}
-                )
-            print(f"✓ Cleanup complete")
-        except Exception as e:
-            print(f"⚠️  Warning: S3 cleanup failed: {e}")
@@ -3,9 +3,14 @@ Azure Speech-to-Text Service
 Handles speech-to-text transcription using Azure AI Services.
 """
 
+import json
 import os
+import queue
+import threading
 import time
-from typing import Dict, Optional
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import azure.cognitiveservices.speech as speechsdk
 from .base_provider import SpeechToTextProvider
 
@@ -13,12 +18,24 @@ from .base_provider import SpeechToTextProvider
 class AzureSpeechToText(SpeechToTextProvider):
     """Handles speech-to-text transcription using Azure Cognitive Services."""
     
+    # PCM format of the warm recognizers' push streams (16 kHz, 16-bit, mono)
+    PUSH_STREAM_SAMPLE_RATE = 16000
+    PUSH_STREAM_SAMPLE_WIDTH = 2
+    PUSH_STREAM_CHANNELS = 1
+    
+    # Warm recognizers idle longer than this are discarded instead of used,
+    # since the service may have closed their connection in the meantime
+    WARM_RECOGNIZER_MAX_IDLE_SECONDS = 60
+    
     def __init__(
         self, 
         subscription_key: str, 
         region: str, 
         language: str = "en-US",
-        endpoint: Optional[str] = None
+        endpoint: Optional[str] = None,
+        continuous: bool = False,
+        max_parallel_recognitions: int = 8,
+        warm_pool_size: int = 0
     ):
         """
         Initialize Azure Speech service.
@@ -28,11 +45,27 @@ class AzureSpeechToText(SpeechToTextProvider):
             region: Azure region (e.g., 'eastus', 'westeurope')
             language: Speech recognition language (default: 'en-US')
             endpoint: Optional custom endpoint URL (for custom models or containers)
+            continuous: Use continuous recognition so files with several
+                utterances are fully transcribed (default: False)
+            max_parallel_recognitions: In continuous mode, number of files a single
+                worker thread recognizes at the same time (default: 8)
+            warm_pool_size: Number of pre-connected recognizers kept ready to
+                receive audio through push streams; 0 disables the pool (default: 0)
         """
         super().__init__()
         self.provider_name = "azure"
         self.subscription_key = subscription_key
         self.region = region
+        self.language = language
+        self.endpoint = endpoint
+        self.continuous = continuous
+        self.max_wait_time = 3600  # seconds per file in continuous mode
+        
+        if continuous:
+            # Event-driven recognitions run on SDK threads, so one worker
+            # thread can drive a whole batch of files at once
+            self.batch_size = max(1, max_parallel_recognitions)
+            self.extra_result_fields = ('segments',)
         
         # Initialize SpeechConfig with endpoint if provided, otherwise use region
         if endpoint:
@@ -51,11 +84,165 @@ class AzureSpeechToText(SpeechToTextProvider):
         
         # Configure silence timeout for better results (Microsoft recommendation)
         # Segmentation silence timeout: 500ms default, adjust if needed
+        self.segmentation_silence_timeout_ms = "1000"
         self.speech_config.set_property(
             speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, 
-            "1000"
+            self.segmentation_silence_timeout_ms
+        )
+        
+        # Warm recognizer pool: recognizers are created and connected in the
+        # background, then fed already-loaded PCM through a push stream, so
+        # connection setup is off the per-file critical path
+        self.warm_pool_size = max(0, warm_pool_size)
+        self._warm_pool: queue.Queue = queue.Queue()
+        self._warm_pool_executor = None
+        if self.warm_pool_size:
+            self._warm_pool_executor = ThreadPoolExecutor(max_workers=min(4, self.warm_pool_size))
+            for _ in range(self.warm_pool_size):
+                self._warm_pool_executor.submit(self._add_warm_recognizer)
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], language: str = "en-US") -> 'AzureSpeechToText':
+        """
+        Create the provider from a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary from the provider config class
+            language: Recognition language (default: 'en-US')
+            
+        Returns:
+            AzureSpeechToText instance
+            
+        Raises:
+            ValueError: If required config is missing
+        """
+        if not config.get('subscription_key'):
+            raise ValueError("subscription_key is required for Azure provider")
+        return cls(
+            subscription_key=config['subscription_key'],
+            region=config.get('region', 'eastus'),
+            language=language,
+            endpoint=config.get('endpoint'),
+            continuous=config.get('continuous', False),
+            max_parallel_recognitions=config.get('max_parallel_recognitions', 8),
+            warm_pool_size=config.get('warm_pool_size', 0)
         )
     
+    def cache_settings(self) -> Dict[str, str]:
+        """Return the endpoint and segmentation settings used for cache keys."""
+        return {
+            "endpoint": self.endpoint or self.region,
+            "segmentation_silence_timeout_ms": self.segmentation_silence_timeout_ms,
+            "continuous": str(self.continuous)
+        }
+    
+    def _create_recognizer(self, audio_file_path: str) -> speechsdk.SpeechRecognizer:
+        """
+        Create a recognizer for an audio file.
+        
+        When the warm pool is enabled and the file is PCM WAV in the push
+        stream format, a pre-connected recognizer is taken from the pool and
+        the file's samples are written to its push stream. Otherwise a new
+        file-based recognizer is created.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            
+        Returns:
+            SpeechRecognizer ready to start recognition
+        """
+        if self.warm_pool_size:
+            frames = self._load_pcm_frames(audio_file_path)
+            if frames is not None:
+                recognizer, push_stream = self._take_warm_recognizer()
+                push_stream.write(frames)
+                push_stream.close()
+                return recognizer
+        
+        audio_config = speechsdk.AudioConfig(filename=audio_file_path)
+        return speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            audio_config=audio_config
+        )
+    
+    def _new_push_stream_recognizer(self):
+        """
+        Create a recognizer reading from a new push stream.
+        
+        Returns:
+            Tuple of (SpeechRecognizer, PushAudioInputStream)
+        """
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=self.PUSH_STREAM_SAMPLE_RATE,
+            bits_per_sample=self.PUSH_STREAM_SAMPLE_WIDTH * 8,
+            channels=self.PUSH_STREAM_CHANNELS
+        )
+        push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            audio_config=speechsdk.audio.AudioConfig(stream=push_stream)
+        )
+        return recognizer, push_stream
+    
+    def _take_warm_recognizer(self):
+        """
+        Take a fresh recognizer from the warm pool.
+        
+        Every entry taken from the pool is replaced in the background, so the
+        pool stays at warm_pool_size. Entries idle for longer than
+        WARM_RECOGNIZER_MAX_IDLE_SECONDS are closed and skipped. When the pool
+        is empty, a new recognizer is created without pre-connecting it.
+        
+        Returns:
+            Tuple of (SpeechRecognizer, PushAudioInputStream)
+        """
+        while True:
+            try:
+                recognizer, push_stream, connection, connected_at = self._warm_pool.get_nowait()
+            except queue.Empty:
+                return self._new_push_stream_recognizer()
+            
+            # Refill the pool in the background
+            self._warm_pool_executor.submit(self._add_warm_recognizer)
+            
+            if time.monotonic() - connected_at <= self.WARM_RECOGNIZER_MAX_IDLE_SECONDS:
+                return recognizer, push_stream
+            
+            try:
+                connection.close()
+            except Exception:
+                pass
+    
+    def _add_warm_recognizer(self) -> None:
+        """Create a push-stream recognizer, pre-connect it and add it to the pool."""
+        try:
+            recognizer, push_stream = self._new_push_stream_recognizer()
+            connection = speechsdk.Connection.from_recognizer(recognizer)
+            connection.open(self.continuous)
+            self._warm_pool.put((recognizer, push_stream, connection, time.monotonic()))
+        except Exception as e:
+            print(f"Warning: could not pre-connect Azure recognizer: {e}")
+    
+    def _load_pcm_frames(self, audio_file_path: str) -> Optional[bytes]:
+        """
+        Load the samples of a WAV file if it matches the push stream format.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            
+        Returns:
+            Raw PCM frames, or None if the file cannot be pushed as-is
+        """
+        try:
+            with wave.open(audio_file_path, 'rb') as wav_file:
+                if (wav_file.getframerate() != self.PUSH_STREAM_SAMPLE_RATE
+                        or wav_file.getsampwidth() != self.PUSH_STREAM_SAMPLE_WIDTH
+                        or wav_file.getnchannels() != self.PUSH_STREAM_CHANNELS):
+                    return None
+                return wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError, OSError):
+            return None
+    
     def transcribe_file(self, audio_file_path: str) -> Dict[str, str]:
         """
         Transcribe a single audio file.
@@ -66,14 +253,13 @@ class AzureSpeechToText(SpeechToTextProvider):
         Returns:
             Dictionary with filename, text, and status
         """
+        if self.continuous:
+            return self.transcribe_batch([audio_file_path])[0]
+        
         filename = os.path.basename(audio_file_path)
         
         try:
-            audio_config = speechsdk.AudioConfig(filename=audio_file_path)
-            speech_recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config,
-                audio_config=audio_config
-            )
+            speech_recognizer = self._create_recognizer(audio_file_path)
             
             print(f"Transcribing: {filename}")
             
@@ -129,3 +315,137 @@ class AzureSpeechToText(SpeechToTextProvider):
                 "status": f"exception: {str(e)}",
                 "transcription_time": ""
             }
+    
+    def requests_per_batch(self, audio_file_paths: List[str]) -> int:
+        """Return one request per file: each file is a separate recognition."""
+        return len(audio_file_paths)
+    
+    def transcribe_batch(self, audio_file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Transcribe several audio files with continuous recognition.
+        
+        Recognition of every file is started at once and driven by SDK event
+        callbacks; the calling thread only waits for the sessions to stop.
+        Each recognized utterance is collected with its offset and duration.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        if not self.continuous:
+            return super().transcribe_batch(audio_file_paths)
+        
+        sessions = [self._start_continuous_recognition(path) for path in audio_file_paths]
+        return [self._finish_continuous_recognition(session) for session in sessions]
+    
+    def _start_continuous_recognition(self, audio_file_path: str) -> Dict:
+        """
+        Start continuous recognition of a file without waiting for it to finish.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            
+        Returns:
+            Session state updated by the recognizer callbacks
+        """
+        session = {
+            'filename': os.path.basename(audio_file_path),
+            'segments': [],
+            'error': None,
+            'done': threading.Event(),
+            'recognizer': None,
+            'start_time': time.time(),
+            'end_time': None
+        }
+        
+        def on_recognized(evt):
+            result = evt.result
+            if result.reason == speechsdk.ResultReason.RecognizedSpeech and result.text:
+                # Offsets and durations are reported in 100-nanosecond ticks
+                session['segments'].append({
+                    'offset': round(result.offset / 1e7, 2),
+                    'duration': round(result.duration / 1e7, 2),
+                    'text': result.text
+                })
+        
+        def on_canceled(evt):
+            cancellation = evt.cancellation_details
+            if cancellation.reason == speechsdk.CancellationReason.Error:
+                error_details = f"Reason={cancellation.reason}, ErrorCode={cancellation.error_code}"
+                if cancellation.error_details:
+                    error_details += f", Details={cancellation.error_details}"
+                session['error'] = error_details
+            session['end_time'] = session['end_time'] or time.time()
+            session['done'].set()
+        
+        def on_session_stopped(evt):
+            session['end_time'] = session['end_time'] or time.time()
+            session['done'].set()
+        
+        try:
+            recognizer = self._create_recognizer(audio_file_path)
+            recognizer.recognized.connect(on_recognized)
+            recognizer.canceled.connect(on_canceled)
+            recognizer.session_stopped.connect(on_session_stopped)
+            
+            print(f"Transcribing (continuous): {session['filename']}")
+            recognizer.start_continuous_recognition_async()
+            session['recognizer'] = recognizer
+        except Exception as e:
+            session['exception'] = str(e)
+            session['done'].set()
+        
+        return session
+    
+    def _finish_continuous_recognition(self, session: Dict) -> Dict[str, str]:
+        """
+        Wait for a continuous recognition session and build its result.
+        
+        Args:
+            session: Session state from _start_continuous_recognition
+            
+        Returns:
+            Dictionary with filename, text, status and segments
+        """
+        filename = session['filename']
+        
+        if 'exception' in session:
+            return {
+                "filename": filename,
+                "text": "",
+                "status": f"exception: {session['exception']}",
+                "transcription_time": ""
+            }
+        
+        finished = session['done'].wait(timeout=max(0.0, self.max_wait_time - (time.time() - session['start_time'])))
+        try:
+            session['recognizer'].stop_continuous_recognition_async().get()
+        except Exception:
+            pass
+        
+        # Sessions of a batch run concurrently, so time each one up to its own
+        # stop event rather than to when its result is collected
+        transcription_time = (session['end_time'] or time.time()) - session['start_time']
+        print(f"✓ Azure transcription time: {transcription_time:.1f}s ({filename})")
+        
+        segments = session['segments']
+        text = " ".join(segment['text'] for segment in segments)
+        
+        if session['error']:
+            status = f"canceled: {session['error']}"
+        elif not finished:
+            status = f"error: recognition exceeded {self.max_wait_time} seconds"
+        elif not segments:
+            status = "no_speech_detected"
+        else:
+            status = "success"
+        
+        return {
+            "filename": filename,
+            "text": text,
+            "status": status,
+            "transcription_time": f"{transcription_time:.2f}",
+            "segments": json.dumps(segments, ensure_ascii=False)
+        }
@@ -3,19 +3,77 @@ Base Speech-to-Text Provider Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
-import csv
-import os
-import re
+from .discovery import iter_audio_files, natural_sort_key, relative_filename
+from .rate_limiter import RateLimiter
+from .result_writer import CSVResultWriter, STANDARD_FIELDS, load_completed_keys
+from .transcription_cache import TranscriptionCache
 
 
 class SpeechToTextProvider(ABC):
     """Abstract base class for speech-to-text providers."""
     
+    # Provider-specific result columns written after the standard ones
+    extra_result_fields: Tuple[str, ...] = ()
+    
+    # Number of files sent per transcribe_batch call (1 = one file per request)
+    batch_size: int = 1
+    
+    # Configuration class (with from_env() and validate()) used when the
+    # provider is registered without one, e.g. through an entry point
+    config_class: Optional[type] = None
+    
     def __init__(self):
-        """Initialize base provider with a provider name."""
+        """Initialize base provider with a provider name and language."""
         self.provider_name = "unknown"
+        self.language = ""
+        self.cache: Optional[TranscriptionCache] = None
+        self.rate_limiter: Optional[RateLimiter] = None
+    
+    def set_rate_limit(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_retries: int = 3
+    ) -> None:
+        """
+        Pace requests to the provider and retry transient errors.
+        
+        Args:
+            requests_per_second: Provider request quota; None disables pacing
+            max_retries: Retries for throttling/unavailable errors (0 disables retries)
+        """
+        if not requests_per_second and not max_retries:
+            self.rate_limiter = None
+        else:
+            self.rate_limiter = RateLimiter(requests_per_second, max_retries)
+    
+    def _rate_limited(self, func, *args, **kwargs):
+        """Call a provider API function through the rate limiter, if configured."""
+        if self.rate_limiter is None:
+            return func(*args, **kwargs)
+        return self.rate_limiter.call(func, *args, **kwargs)
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], language: str = "en-US") -> 'SpeechToTextProvider':
+        """
+        Create the provider from a configuration dictionary.
+        
+        The default passes the configuration entries as keyword arguments to
+        the constructor; providers with required settings override this to
+        validate them.
+        
+        Args:
+            config: Configuration dictionary from the provider config class
+            language: Recognition language (default: 'en-US')
+            
+        Returns:
+            Provider instance
+        """
+        return cls(language=language, **config)
     
     @staticmethod
     def _natural_sort_key(path: str) -> List:
@@ -23,20 +81,13 @@ class SpeechToTextProvider(ABC):
         Generate a sort key for natural/numeric sorting.
         Converts '10' to integer 10 instead of string '10'.
         
-        Example:
-            'p1_2.wav' -> ['p', 1, '_', 2, '.wav']
-            'p1_10.wav' -> ['p', 1, '_', 10, '.wav']
-        
         Args:
             path: File path string
             
         Returns:
             List of strings and integers for natural sorting
         """
-        def convert(text):
-            return int(text) if text.isdigit() else text.lower()
-        
-        return [convert(c) for c in re.split('([0-9]+)', path)]
+        return natural_sort_key(path)
     
     @abstractmethod
     def transcribe_file(self, audio_file_path: str) -> Dict[str, str]:
@@ -51,129 +102,378 @@ class SpeechToTextProvider(ABC):
         """
         pass
     
+    def cache_settings(self) -> Dict[str, str]:
+        """
+        Return provider settings that change the transcription output.
+        
+        These are combined with the audio hash, provider name and language to
+        build transcription cache keys. Providers override this to include
+        their model or recognition parameters.
+        
+        Returns:
+            Dictionary of setting names to values
+        """
+        return {}
+    
+    def _cache_key(self, audio_file_path: str) -> Optional[str]:
+        """
+        Build the transcription cache key for an audio file.
+        
+        Returns None when the file cannot be read, so the file is treated as
+        a cache miss and the provider reports the error in its result row.
+        """
+        try:
+            return TranscriptionCache.make_key(
+                audio_file_path,
+                self.provider_name,
+                self.language,
+                self.cache_settings()
+            )
+        except OSError:
+            return None
+    
+    def transcribe_batch(self, audio_file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Transcribe several audio files in one unit of work.
+        
+        Providers whose service can process several files per request
+        override this and set `batch_size` above 1. The default transcribes
+        the files one by one.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        return [self.transcribe_file(audio_file_path) for audio_file_path in audio_file_paths]
+    
+    def requests_per_batch(self, audio_file_paths: List[str]) -> int:
+        """
+        Return how many service requests a transcribe_batch call makes.
+        
+        Used to take the right number of tokens from the request quota. The
+        default counts a batch as one request, as for batch endpoints;
+        providers that send each file of a batch separately override this.
+        
+        Args:
+            audio_file_paths: Paths to the audio files in the batch
+            
+        Returns:
+            Number of requests
+        """
+        return 1
+    
+    def _dispatch_batch(self, audio_file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Send a batch to the provider under the rate limiter.
+        
+        Each transcribe_batch call takes requests_per_batch() tokens from the
+        request quota.
+        Files whose result status reports a transient error (HTTP 429/503,
+        throttling, resource exhausted, ...) are sent again with exponential
+        backoff until they succeed or the retries run out.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self.transcribe_batch(audio_file_paths)
+        
+        limiter.acquire(self.requests_per_batch(audio_file_paths))
+        results = self.transcribe_batch(audio_file_paths)
+        
+        for attempt in range(limiter.max_retries):
+            retry = [i for i, result in enumerate(results) if limiter.is_retryable_result(result)]
+            if not retry:
+                break
+            
+            print(f"Retrying {len(retry)} file(s) after transient error: {results[retry[0]]['status']}")
+            limiter.backoff(attempt)
+            retry_paths = [audio_file_paths[i] for i in retry]
+            limiter.acquire(self.requests_per_batch(retry_paths))
+            retried = self.transcribe_batch(retry_paths)
+            for i, result in zip(retry, retried):
+                results[i] = result
+        
+        return results
+    
+    def _transcribe_with_cache(self, audio_file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Transcribe a batch of files, consulting the transcription cache first if enabled.
+        
+        Only files missing from the cache are sent to the provider, and only
+        successful transcriptions are stored in the cache.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        if self.cache is None:
+            return self._dispatch_batch(audio_file_paths)
+        
+        results: List[Optional[Dict[str, str]]] = []
+        keys = {}
+        for audio_file_path in audio_file_paths:
+            key = self._cache_key(audio_file_path)
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                results.append(self._cached_result(audio_file_path, cached))
+            else:
+                keys[audio_file_path] = key
+                results.append(None)
+        
+        if keys:
+            transcribed = iter(self._dispatch_batch(list(keys)))
+            for i, audio_file_path in enumerate(audio_file_paths):
+                if results[i] is None:
+                    results[i] = next(transcribed)
+                    if results[i].get('status') == 'success' and keys[audio_file_path] is not None:
+                        self.cache.put(keys[audio_file_path], results[i])
+        
+        return results
+    
+    @staticmethod
+    def find_audio_files(
+        audio_dir: str,
+        supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac'),
+        recursive: bool = False,
+        pattern: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Lazily list the audio files in a directory, sorted naturally within each directory.
+        
+        Args:
+            audio_dir: Directory containing audio files
+            supported_extensions: Tuple of supported audio file extensions
+            recursive: Also scan subdirectories
+            pattern: Glob matched against the path relative to audio_dir
+            
+        Returns:
+            Iterator of audio file paths
+            
+        Raises:
+            ValueError: If the directory does not exist
+        """
+        return iter_audio_files(audio_dir, supported_extensions, recursive, pattern)
+    
     def transcribe_directory(
         self,
         audio_dir: str,
         output_csv: str,
-        supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac')
+        supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac'),
+        concurrency: int = 1,
+        resume: bool = False,
+        recursive: bool = False,
+        pattern: Optional[str] = None
     ) -> None:
         """
         Transcribe all audio files in a directory and save to CSV.
         
+        Files are discovered lazily and handed to the dispatcher as the
+        directory tree is scanned. Result filenames are paths relative to
+        audio_dir.
+        
         Args:
             audio_dir: Directory containing audio files
             output_csv: Output CSV file path
             supported_extensions: Tuple of supported audio file extensions
+            concurrency: Number of files to transcribe in parallel (default: 1)
+            resume: Skip files already transcribed successfully in output_csv
+            recursive: Also transcribe files in subdirectories
+            pattern: Only transcribe files whose relative path matches this glob
         """
-        audio_dir_path = Path(audio_dir)
+        audio_files = self.find_audio_files(audio_dir, supported_extensions, recursive, pattern)
         
-        if not audio_dir_path.exists():
-            raise ValueError(f"Directory not found: {audio_dir}")
+        if resume:
+            audio_files = self._filter_completed(audio_files, load_completed_keys(output_csv), audio_dir)
         
-        # Find all audio files
-        audio_files = [
-            str(f) for f in audio_dir_path.iterdir()
-            if f.is_file() and f.suffix.lower() in supported_extensions
-        ]
-        
-        if not audio_files:
-            print(f"No audio files found in {audio_dir}")
+        first_file = next(audio_files, None)
+        if first_file is None:
+            if resume:
+                print("All files already transcribed, nothing to resume")
+            else:
+                print(f"No audio files found in {audio_dir}")
             return
         
-        print(f"Found {len(audio_files)} audio files")
+        # Transcribe all files (sorted naturally by filename), writing each
+        # result to the CSV as soon as it is available
+        audio_files = chain([first_file], audio_files)
         
-        # Transcribe all files (sorted naturally by filename)
-        results = []
-        total_files = len(audio_files)
+        with CSVResultWriter(output_csv, self._result_fieldnames()) as writer:
+            for i, result in enumerate(self.transcribe_files(audio_files, concurrency, audio_dir), 1):
+                print(f"Processing {i}: {result['filename']}")
+                writer.write(result)
         
-        for i, audio_file in enumerate(sorted(audio_files, key=self._natural_sort_key), 1):
-            filename = Path(audio_file).name
-            print(f"Processing {i} of {total_files}: {filename}")
-            
-            result = self.transcribe_file(audio_file)
-            # Add provider name to result
-            result['provider'] = self.provider_name
-            
-            # Extract metadata from filename
-            # Format: {person}_{audio-number}_{noise-type}_{snr-level}
-            filename = Path(audio_file).stem
-            parts = filename.split('_')
+        print(f"\nTranscribed {writer.rows_written} audio files")
+        if writer.appending:
+            print(f"Results appended to: {output_csv}")
+        else:
+            print(f"Results saved to: {output_csv}")
+    
+    def transcribe_files(
+        self,
+        audio_files: Iterable[str],
+        concurrency: int = 1,
+        audio_dir: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Transcribe files and yield complete result rows in input order.
+        
+        Results include the provider, language and filename metadata columns.
+        
+        Args:
+            audio_files: Audio file paths (consumed lazily)
+            concurrency: Maximum number of parallel requests
+            audio_dir: Root directory; result filenames are made relative to it
             
-            # Flexible extraction: map available parts to fields in order
-            if len(parts) > 0: result['person'] = parts[0]
-            if len(parts) > 1: result['audio'] = parts[1]
-            if len(parts) > 2: result['noise'] = parts[2]
-            if len(parts) > 3: result['snr'] = parts[3]
+        Yields:
+            Result dictionaries ready to be written to the CSV
+        """
+        for audio_file, result in self._iter_transcriptions(audio_files, concurrency):
+            self._finalize_result(result, audio_file, audio_dir)
+            yield result
+    
+    def _filter_completed(
+        self,
+        audio_files: Iterable[str],
+        completed: Set[Tuple[str, str, str]],
+        audio_dir: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Drop files already transcribed successfully by this provider and language.
+        
+        Args:
+            audio_files: Audio file paths
+            completed: (filename, provider, language) keys from load_completed_keys
+            audio_dir: Root directory the result filenames are relative to
             
-            results.append(result)
+        Yields:
+            Audio files that still need to be transcribed
+        """
+        for audio_file in audio_files:
+            filename = relative_filename(audio_file, audio_dir)
+            if ((filename, self.provider_name, self.language) not in completed
+                    and (filename, self.provider_name, '') not in completed):
+                yield audio_file
+    
+    def _result_fieldnames(self) -> List[str]:
+        """Return the CSV columns for this provider's results."""
+        fieldnames = STANDARD_FIELDS + list(self.extra_result_fields)
+        if self.cache is not None:
+            fieldnames.append('cached')
+        return fieldnames
+    
+    @staticmethod
+    def _cached_result(audio_file_path: str, cached: Dict[str, str]) -> Dict[str, str]:
+        """
+        Build the result row for a transcription served from the cache.
         
-        # Check if we're appending or creating new file
-        file_exists = os.path.exists(output_csv)
+        The row is marked cached and its transcription_time is left empty, so
+        cache hits do not count as provider calls in latency benchmarks.
         
-        # Save to CSV
-        self._save_to_csv(results, output_csv)
+        Args:
+            audio_file_path: Path to the audio file
+            cached: Cached result from TranscriptionCache.get
         
-        if file_exists:
-            print(f"\nResults appended to: {output_csv}")
-        else:
-            print(f"\nResults saved to: {output_csv}")
+        Returns:
+            Result dictionary
+        """
+        return {
+            "filename": Path(audio_file_path).name,
+            **cached,
+            "transcription_time": "",
+            "cached": "true"
+        }
     
-    def _save_to_csv(self, results: List[Dict[str, str]], output_file: str) -> None:
+    def _iter_transcriptions(
+        self,
+        audio_files: Iterable[str],
+        concurrency: int = 1
+    ) -> Iterator[Tuple[str, Dict[str, str]]]:
         """
-        Save transcription results to CSV.
-        If the file exists, append results to it. Otherwise, create a new file.
+        Transcribe files and yield results in the same order as the input.
+        
+        Files are grouped into batches of `batch_size` (one file per batch
+        unless the provider supports batch requests). With concurrency > 1,
+        batches are dispatched to a bounded thread pool so that up to
+        `concurrency` requests are in flight at once. Only a small window of
+        batches ahead of the next result to be yielded is submitted, which
+        keeps memory bounded on large directories.
         
         Args:
-            results: List of transcription results
-            output_file: Output CSV file path
+            audio_files: Ordered audio file paths (consumed lazily)
+            concurrency: Maximum number of parallel requests
+            
+        Yields:
+            Tuples of (audio_file, result) in input order
         """
-        if not results:
+        files = iter(audio_files)
+        batches = iter(lambda: list(islice(files, max(1, self.batch_size))), [])
+        
+        if concurrency <= 1:
+            for batch in batches:
+                yield from zip(batch, self._transcribe_with_cache(batch))
             return
         
-        # Collect all unique fields from all results
-        fieldnames = []
-        all_keys = set()
-        for result in results:
-            all_keys.update(result.keys())
-        
-        # Standard fields first (provider added as first column after filename)
-        standard_fields = ['filename', 'person', 'audio', 'noise', 'snr', 'provider', 'text', 'status', 'transcription_time']
-        fieldnames = [f for f in standard_fields if f in all_keys]
-        
-        # Add any additional fields
-        additional_fields = sorted(all_keys - set(standard_fields))
-        fieldnames.extend(additional_fields)
-        
-        # Check if file exists to determine if we should append or create new
-        file_exists = os.path.exists(output_file)
-        
-        # If file exists, verify it has content and read the existing fieldnames
-        if file_exists:
-            try:
-                with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    existing_fieldnames = reader.fieldnames
-                    if existing_fieldnames:
-                        # Use existing fieldnames to maintain consistency
-                        # Add any new fields that don't exist yet
-                        for field in fieldnames:
-                            if field not in existing_fieldnames:
-                                existing_fieldnames.append(field)
-                        fieldnames = existing_fieldnames
-            except (IOError, csv.Error):
-                # If there's an error reading the file, treat it as new
-                file_exists = False
-        
-        # Open file in append mode if it exists, write mode if new
-        mode = 'a' if file_exists else 'w'
-        
-        with open(output_file, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(
+                (batch, executor.submit(self._transcribe_with_cache, batch))
+                for batch in islice(batches, concurrency * 2)
+            )
             
-            # Only write header if creating a new file
-            if not file_exists:
-                writer.writeheader()
-            
-            # Write all results
-            for result in results:
-                writer.writerow(result)
+            while pending:
+                batch, future = pending.popleft()
+                results = future.result()
+                
+                # Refill the window before handing the results back
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    pending.append((next_batch, executor.submit(self._transcribe_with_cache, next_batch)))
+                
+                yield from zip(batch, results)
+    
+    def _finalize_result(
+        self,
+        result: Dict[str, str],
+        audio_file_path: str,
+        audio_dir: Optional[str] = None
+    ) -> None:
+        """
+        Add provider name, language and filename metadata to a result.
+        
+        Args:
+            result: Result dictionary (modified in place)
+            audio_file_path: Path to the transcribed audio file
+            audio_dir: Root directory; the filename is made relative to it
+        """
+        result['filename'] = relative_filename(audio_file_path, audio_dir)
+        result['provider'] = self.provider_name
+        result['language'] = self.language
+        if self.cache is not None:
+            result.setdefault('cached', 'false')
+        self._add_filename_metadata(result, Path(audio_file_path).name)
+    
+    def _add_filename_metadata(self, result: Dict, filename: str) -> None:
+        """
+        Extract and add metadata from filename to result dictionary.
+        Expected format: {person}_{audio}_{noise}_{snr}.ext
+        
+        Args:
+            result: Result dictionary (modified in place)
+            filename: Audio filename
+        """
+        filename_stem = Path(filename).stem
+        parts = filename_stem.split('_')
+        
+        # Flexible extraction: map available parts to fields in order
+        if len(parts) > 0: result['person'] = parts[0]
+        if len(parts) > 1: result['audio'] = parts[1]
+        if len(parts) > 2: result['noise'] = parts[2]
+        if len(parts) > 3: result['snr'] = parts[3]
@@ -5,35 +5,101 @@ Handles speech-to-text transcription using a custom local/remote service.
 
 import os
 import time
+from contextlib import ExitStack
 import requests
-from typing import Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List
 from .base_provider import SpeechToTextProvider
 
 
 class CustomServiceProvider(SpeechToTextProvider):
     """Handles speech-to-text transcription using a custom HTTP service."""
     
-    def __init__(self, service_uri: str, language: str = "en-US"):
+    def __init__(
+        self,
+        service_uri: str,
+        language: str = "en-US",
+        pool_size: int = 10,
+        timeout: int = 300,
+        max_batch_size: int = 16
+    ):
         """
         Initialize Custom Service provider.
         
         Args:
             service_uri: Base URI of the transcription service (e.g., 'http://0.0.0.0:8000')
             language: Speech recognition language (default: 'en-US')
+            pool_size: Maximum number of keep-alive connections to the service;
+                should be at least the number of concurrent transcriptions (default: 10)
+            timeout: Request timeout in seconds (default: 300)
+            max_batch_size: Upper bound on files per batch request when the
+                service advertises batch support; 1 disables batching (default: 16)
         """
         super().__init__()
         self.provider_name = "custom"
         self.service_uri = service_uri.rstrip('/')
         self.language = language
+        self.timeout = timeout
         self.transcribe_endpoint = f"{self.service_uri}/transcribe"
+        self.batch_endpoint = f"{self.service_uri}/transcribe/batch"
+        
+        # Reuse keep-alive connections across requests (and worker threads)
+        # instead of opening a new TCP connection per file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Verify service is available
         try:
-            health_response = requests.get(self.service_uri, timeout=5)
+            health_response = self.session.get(self.service_uri, timeout=5)
             health_response.raise_for_status()
             print(f"✓ Connected to custom service at {self.service_uri}")
         except Exception as e:
             print(f"Warning: Could not connect to service at {self.service_uri}: {e}")
+            return
+        
+        # Enable batch mode if the service advertises it on the health check,
+        # e.g. {"batch": true, "max_batch_size": 32}
+        try:
+            health = health_response.json()
+        except ValueError:
+            health = {}
+        
+        if isinstance(health, dict) and health.get('batch'):
+            service_max = int(health.get('max_batch_size', max_batch_size))
+            self.batch_size = max(1, min(max_batch_size, service_max))
+            if self.batch_size > 1:
+                print(f"✓ Batch mode enabled: up to {self.batch_size} files per request")
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], language: str = "en-US") -> 'CustomServiceProvider':
+        """
+        Create the provider from a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary from the provider config class
+            language: Recognition language (default: 'en-US')
+            
+        Returns:
+            CustomServiceProvider instance
+            
+        Raises:
+            ValueError: If required config is missing
+        """
+        if not config.get('service_uri'):
+            raise ValueError("service_uri is required for Custom Service provider")
+        return cls(
+            service_uri=config['service_uri'],
+            language=language,
+            pool_size=config.get('pool_size', 10),
+            timeout=config.get('timeout', 300),
+            max_batch_size=config.get('max_batch_size', 16)
+        )
+    
+    def cache_settings(self) -> Dict[str, str]:
+        """Return the service URI used for cache keys."""
+        return {"service_uri": self.service_uri}
     
     def transcribe_file(self, audio_file_path: str) -> Dict[str, str]:
         """
@@ -58,10 +124,10 @@ class CustomServiceProvider(SpeechToTextProvider):
                 files = {'file': (filename, audio_file)}
                 
                 # Send POST request to transcription endpoint
-                response = requests.post(
+                response = self.session.post(
                     self.transcribe_endpoint,
                     files=files,
-                    timeout=300  # 5 minutes timeout for large files
+                    timeout=self.timeout
                 )
                 
                 # Check response status
@@ -113,3 +179,96 @@ class CustomServiceProvider(SpeechToTextProvider):
                 "status": f"exception: {str(e)}",
                 "transcription_time": ""
             }
+    
+    def transcribe_batch(self, audio_file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Transcribe several audio files with a single request to the batch endpoint.
+        
+        All files are sent as repeated 'files' fields of one multipart POST to
+        /transcribe/batch. The service returns a list of {"filename", "text"}
+        objects (or {"results": [...]}). Each file is uploaded as
+        "<index>-<basename>" so files with the same name from different
+        directories stay distinct; results are matched back by that name, or
+        by position when filenames are missing. An item with a non-empty
+        "error", or a "status" other than "success", is reported as a failed
+        file. The reported transcription_time is the latency of the whole
+        batch request.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        if len(audio_file_paths) == 1:
+            return [self.transcribe_file(audio_file_paths[0])]
+        
+        filenames = [os.path.basename(path) for path in audio_file_paths]
+        upload_names = [f"{i}-{filename}" for i, filename in enumerate(filenames)]
+        
+        try:
+            print(f"Transcribing batch of {len(filenames)}: {filenames[0]} ... {filenames[-1]}")
+            
+            start_time = time.time()
+            
+            with ExitStack() as stack:
+                files = [
+                    ('files', (upload_name, stack.enter_context(open(path, 'rb'))))
+                    for upload_name, path in zip(upload_names, audio_file_paths)
+                ]
+                response = self.session.post(
+                    self.batch_endpoint,
+                    files=files,
+                    timeout=self.timeout
+                )
+            
+            response.raise_for_status()
+            payload = response.json()
+            
+            transcription_time = time.time() - start_time
+            print(f"✓ Custom service batch transcription time: {transcription_time:.1f}s")
+            
+            items = payload.get('results', []) if isinstance(payload, dict) else payload
+            by_name = {item['filename']: item for item in items if item.get('filename')}
+            
+            results = []
+            for i, filename in enumerate(filenames):
+                item = by_name.get(upload_names[i])
+                if item is None and not by_name and i < len(items):
+                    item = items[i]
+                
+                if item is None:
+                    results.append(self._error_result(filename, "error: missing from batch response"))
+                elif item.get('error') or item.get('status', 'success') != 'success':
+                    error = item.get('error') or item['status']
+                    results.append(self._error_result(filename, f"error: {error}"))
+                else:
+                    results.append({
+                        "filename": filename,
+                        "text": item.get('text', ''),
+                        "status": "success",
+                        "transcription_time": f"{transcription_time:.2f}"
+                    })
+            
+            return results
+            
+        except requests.exceptions.Timeout:
+            status = "error: request timeout"
+        except requests.exceptions.ConnectionError:
+            status = f"error: cannot connect to service at {self.service_uri}"
+        except requests.exceptions.HTTPError as e:
+            status = f"error: HTTP {e.response.status_code}"
+        except Exception as e:
+            status = f"exception: {str(e)}"
+        
+        return [self._error_result(filename, status) for filename in filenames]
+    
+    @staticmethod
+    def _error_result(filename: str, status: str) -> Dict[str, str]:
+        """Build a result row for a file that could not be transcribed."""
+        return {
+            "filename": filename,
+            "text": "",
+            "status": status,
+            "transcription_time": ""
+        }
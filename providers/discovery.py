@@ -0,0 +1,115 @@
+"""
+Audio File Discovery
+Lazily lists audio files in a directory tree using os.scandir.
+"""
+
+import os
+import re
+from fnmatch import fnmatch
+from typing import Iterator, List, Optional
+
+
+def natural_sort_key(path: str) -> List:
+    """
+    Generate a sort key for natural/numeric sorting.
+    Converts '10' to integer 10 instead of string '10'.
+    
+    Example:
+        'p1_2.wav' -> ['p', 1, '_', 2, '.wav']
+        'p1_10.wav' -> ['p', 1, '_', 10, '.wav']
+    
+    Args:
+        path: File path string
+    
+    Returns:
+        List of strings and integers for natural sorting
+    """
+    def convert(text):
+        return int(text) if text.isdigit() else text.lower()
+    
+    return [convert(c) for c in re.split('([0-9]+)', path)]
+
+
+def relative_filename(audio_file_path: str, audio_dir: Optional[str] = None) -> str:
+    """
+    Return the name used for a file in results: its path relative to
+    audio_dir with '/' separators, or its base name without audio_dir.
+    
+    Args:
+        audio_file_path: Path to the audio file
+        audio_dir: Root directory of the scan
+    
+    Returns:
+        Relative filename
+    """
+    if audio_dir is None:
+        return os.path.basename(audio_file_path)
+    return os.path.relpath(audio_file_path, audio_dir).replace(os.sep, '/')
+
+
+def iter_audio_files(
+    audio_dir: str,
+    supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac'),
+    recursive: bool = False,
+    pattern: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield the audio files under a directory.
+    
+    Each directory is read once with os.scandir, whose entries carry the
+    file type, so no extra stat call is made per file. Files are yielded
+    directory by directory, sorted naturally within each directory, and
+    subdirectories are visited in natural order after the directory's own
+    files; symlinked subdirectories are skipped. Paths are produced as the
+    tree is walked, so the dispatcher can start before a large corpus has
+    been fully listed.
+    
+    Args:
+        audio_dir: Directory containing audio files
+        supported_extensions: Tuple of supported audio file extensions
+        recursive: Also scan subdirectories
+        pattern: Glob matched against the path relative to audio_dir
+            (e.g. 'speaker_01/*' or '*_cafe_*'); None matches every file
+    
+    Returns:
+        Iterator of audio file paths
+    
+    Raises:
+        ValueError: If the directory does not exist
+    """
+    if not os.path.isdir(audio_dir):
+        raise ValueError(f"Directory not found: {audio_dir}")
+    
+    extensions = tuple(ext.lower() for ext in supported_extensions)
+    return _scan(audio_dir, audio_dir, extensions, recursive, pattern)
+
+
+def _scan(
+    directory: str,
+    audio_dir: str,
+    extensions: tuple,
+    recursive: bool,
+    pattern: Optional[str]
+) -> Iterator[str]:
+    """Yield matching files in a directory, then recurse into its subdirectories."""
+    files = []
+    subdirs = []
+    
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if not entry.name.lower().endswith(extensions):
+                    continue
+                if pattern and not fnmatch(relative_filename(entry.path, audio_dir), pattern):
+                    continue
+                files.append(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                # Like os.walk, symlinked directories are not descended into,
+                # so symlink cycles cannot make the scan loop
+                subdirs.append(entry.path)
+    
+    files.sort(key=natural_sort_key)
+    yield from files
+    
+    for subdir in sorted(subdirs, key=natural_sort_key):
+        yield from _scan(subdir, audio_dir, extensions, recursive, pattern)
@@ -2,7 +2,9 @@
 
 import os
 import time
-from typing import Optional
+import uuid
+import wave
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from google.cloud.speech_v2 import SpeechClient  # type: ignore
 from google.cloud.speech_v2.types import cloud_speech  # type: ignore
 from google.oauth2 import service_account  # type: ignore
@@ -12,12 +14,30 @@ from .base_provider import SpeechToTextProvider
 class GoogleSpeechToText(SpeechToTextProvider):
     """Google Cloud Speech-to-Text implementation using v2 API."""
     
+    # Synchronous Recognize rejects inline audio above 10 MB or about one minute
+    SYNC_MAX_BYTES = 10 * 1024 * 1024
+    SYNC_MAX_SECONDS = 60
+    
+    # Streaming sessions accept about five minutes of audio; longer PCM WAV
+    # files are streamed in windows of STREAM_WINDOW_SECONDS, one session each
+    STREAM_MAX_SECONDS = 300
+    STREAM_WINDOW_SECONDS = 240
+    
+    # Streaming audio is sent in chunks within the 15 KB per-request limit of
+    # the v2 API (StreamingRecognizeRequest.audio)
+    STREAM_CHUNK_BYTES = 15000
+    
     def __init__(
         self, 
         project_id: str, 
         location: str,
         language: str = "en-US",
-        credentials_file: Optional[str] = None
+        credentials_file: Optional[str] = None,
+        gcs_bucket: Optional[str] = None,
+        batch_size: int = 15,
+        batch_timeout: int = 3600,
+        recognizer: Optional[str] = None,
+        streaming: bool = False
     ):
         """
         Initialize Google Speech-to-Text client.
@@ -28,17 +48,39 @@ class GoogleSpeechToText(SpeechToTextProvider):
             language: Language code for transcription (default: "en-US")
             credentials_file: Path to service account JSON file (optional)
                 If not provided, uses Application Default Credentials (ADC)
+            gcs_bucket: Cloud Storage bucket for staging audio (optional)
+                If provided, directories are transcribed with BatchRecognize
+            batch_size: Files per BatchRecognize request, at most 15 (default: 15)
+            batch_timeout: Seconds to wait for a BatchRecognize operation (default: 3600)
+            recognizer: Pre-created recognizer ID or full resource name (optional)
+                If not provided, the default recognizer "_" is used
+            streaming: Use streaming recognition for every file (default: False)
+                Files too long for synchronous recognition are always streamed,
+                and files too long for one streaming session go to
+                BatchRecognize when gcs_bucket is set
         """
         super().__init__()
         self.provider_name = "google"
         self.project_id = project_id
         self.location = location
         self.language = language
+        self.model = "chirp_3"
+        self.streaming = streaming
+        
+        # Resolve the recognizer resource and prebuild the recognition config
+        # once, so per-file work is only the audio payload
+        recognizer = recognizer or "_"
+        if "/" not in recognizer:
+            recognizer = f"projects/{project_id}/locations/{location}/recognizers/{recognizer}"
+        self.recognizer = recognizer
+        self._recognition_configs: Dict[Tuple[str, str], cloud_speech.RecognitionConfig] = {}
+        self._recognition_config(self.language, self.model)
         
         client_options = {
             "api_endpoint": f"{self.location}-speech.googleapis.com"
         }
         # Initialize client with appropriate credentials
+        credentials = None
         if credentials_file and os.path.exists(credentials_file):
             credentials = service_account.Credentials.from_service_account_file(
                 credentials_file
@@ -48,31 +90,117 @@ class GoogleSpeechToText(SpeechToTextProvider):
             # Use Application Default Credentials (ADC)
             self.client = SpeechClient(client_options=client_options)
         
+        # Batch mode: stage audio in Cloud Storage and send up to 15 files per
+        # BatchRecognize request. google-cloud-storage honors
+        # STORAGE_EMULATOR_HOST, so a local GCS emulator can stand in for tests.
+        self.gcs_bucket = gcs_bucket
+        self.batch_timeout = batch_timeout
+        if gcs_bucket:
+            from google.cloud import storage  # type: ignore
+            
+            storage_client = storage.Client(project=project_id, credentials=credentials)
+            self.bucket = storage_client.bucket(gcs_bucket)
+            self.batch_size = max(1, min(batch_size, 15))
+        
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], language: str = "en-US") -> 'GoogleSpeechToText':
+        """
+        Create the provider from a configuration dictionary.
+        
+        Args:
+            config: Configuration dictionary from the provider config class
+            language: Recognition language (default: 'en-US')
+            
+        Returns:
+            GoogleSpeechToText instance
+            
+        Raises:
+            ValueError: If required config is missing
+        """
+        if not config.get('project_id'):
+            raise ValueError("project_id is required for Google provider")
+        return cls(
+            project_id=config['project_id'],
+            location=config.get('location', 'global'),
+            language=language,
+            credentials_file=config.get('credentials_file'),
+            gcs_bucket=config.get('gcs_bucket'),
+            batch_size=config.get('batch_size', 15),
+            recognizer=config.get('recognizer'),
+            streaming=config.get('streaming', False)
+        )
+    
+    def cache_settings(self) -> Dict[str, str]:
+        """Return the recognition model, recognizer and mode used for cache keys."""
+        return {
+            "model": self.model,
+            "recognizer": self.recognizer,
+            "streaming": str(self.streaming)
+        }
+    
+    def _recognition_config(
+        self,
+        language: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> cloud_speech.RecognitionConfig:
+        """
+        Return the cached RecognitionConfig for a language and model.
+        
+        Args:
+            language: Language code (default: provider language)
+            model: Recognition model (default: provider model)
+            
+        Returns:
+            RecognitionConfig built once per (language, model)
+        """
+        key = (language or self.language, model or self.model)
+        config = self._recognition_configs.get(key)
+        if config is None:
+            config = cloud_speech.RecognitionConfig(
+                auto_decoding_config=cloud_speech.AutoDetectDecodingConfig(),
+                language_codes=[key[0]],
+                model=key[1],
+            )
+            self._recognition_configs[key] = config
+        return config
+    
     def transcribe_file(self, audio_file: str) -> dict:
         """
         Transcribe an audio file using Google Cloud Speech-to-Text.
         
+        The recognition method is chosen from the audio duration (read from
+        the WAV header; other formats fall back to the file size): synchronous
+        Recognize up to SYNC_MAX_SECONDS, streaming up to STREAM_MAX_SECONDS,
+        and BatchRecognize (or windowed streaming without a staging bucket)
+        beyond that.
+        
         Args:
             audio_file: Path to the audio file to transcribe
             
         Returns:
             Dictionary with 'text' and 'status' keys
         """
+        try:
+            method = self._recognition_method(audio_file)
+        except Exception as e:
+            return self._error_result(audio_file, f"error: {str(e)}")
+        
+        if method == "batch":
+            return self._batch_recognize([audio_file])[0]
+        if method == "windowed":
+            return self._transcribe_streaming(audio_file, windowed=True)
+        if method == "streaming":
+            return self._transcribe_streaming(audio_file)
+        
         try:
             # Read audio file
             with open(audio_file, "rb") as f:
                 audio_content = f.read()
             
             # Configure recognition request
-            config = cloud_speech.RecognitionConfig(
-                auto_decoding_config=cloud_speech.AutoDetectDecodingConfig(),
-                language_codes=[self.language],
-                model="chirp_3",
-            )
-            
             request = cloud_speech.RecognizeRequest(
-                recognizer=f"projects/{self.project_id}/locations/{self.location}/recognizers/_",
-                config=config,
+                recognizer=self.recognizer,
+                config=self._recognition_config(),
                 content=audio_content,
             )
             
@@ -100,10 +228,299 @@ class GoogleSpeechToText(SpeechToTextProvider):
             }
             
         except Exception as e:
-            filename = os.path.basename(audio_file)
+            return self._error_result(audio_file, f"error: {str(e)}")
+    
+    def _recognition_method(self, audio_file: str) -> str:
+        """
+        Choose how to recognize a file from its duration and size.
+        
+        Args:
+            audio_file: Path to the audio file
+            
+        Returns:
+            'sync', 'streaming', 'windowed' or 'batch'
+        """
+        size = os.path.getsize(audio_file)
+        duration = self._wav_duration(audio_file)
+        
+        if duration is None:
+            # Unknown duration: only the inline size limit can be checked
+            if size > self.SYNC_MAX_BYTES:
+                return "batch" if self.gcs_bucket else "streaming"
+            return "streaming" if self.streaming else "sync"
+        
+        if duration > self.STREAM_MAX_SECONDS:
+            return "batch" if self.gcs_bucket else "windowed"
+        if self.streaming or duration > self.SYNC_MAX_SECONDS or size > self.SYNC_MAX_BYTES:
+            return "streaming"
+        return "sync"
+    
+    @staticmethod
+    def _wav_duration(audio_file: str) -> Optional[float]:
+        """Return the duration of a PCM WAV file in seconds, or None for other formats."""
+        try:
+            with wave.open(audio_file, 'rb') as wav_file:
+                return wav_file.getnframes() / float(wav_file.getframerate())
+        except (wave.Error, EOFError):
+            return None
+    
+    @staticmethod
+    def _error_result(audio_file: str, status: str) -> Dict[str, str]:
+        """Build a result row for a file that could not be transcribed."""
+        return {
+            "filename": os.path.basename(audio_file),
+            "text": "",
+            "status": status,
+            "transcription_time": ""
+        }
+    
+    def _transcribe_streaming(self, audio_file: str, windowed: bool = False) -> Dict[str, str]:
+        """
+        Transcribe an audio file with streaming recognition.
+        
+        The file is read from disk in fixed-size chunks as the request stream
+        is consumed, so memory use does not depend on the audio length, and
+        final results are assembled as they arrive. With `windowed`, a PCM
+        WAV file longer than one streaming session allows is sent as
+        consecutive sessions of STREAM_WINDOW_SECONDS each.
+        
+        Args:
+            audio_file: Path to the audio file to transcribe
+            windowed: Restart the stream every STREAM_WINDOW_SECONDS of audio
+            
+        Returns:
+            Dictionary with filename, text, and status
+        """
+        filename = os.path.basename(audio_file)
+        
+        try:
+            print(f"Transcribing (streaming): {filename}")
+            
+            start_time = time.time()
+            if windowed:
+                sessions = self._windowed_streaming_requests(audio_file)
+            else:
+                sessions = iter([self._streaming_requests(audio_file)])
+            
+            # Keep only final results; interim hypotheses are discarded
+            segments = []
+            for requests in sessions:
+                for response in self.client.streaming_recognize(requests=requests):
+                    for result in response.results:
+                        if result.is_final and result.alternatives:
+                            segments.append(result.alternatives[0].transcript.strip())
+            
+            transcription_time = time.time() - start_time
+            print(f"✓ Google transcription time: {transcription_time:.1f}s")
+            
+            return {
+                "filename": filename,
+                "text": " ".join(segment for segment in segments if segment),
+                "status": "success",
+                "transcription_time": f"{transcription_time:.2f}"
+            }
+            
+        except Exception as e:
             return {
                 "filename": filename,
                 "text": "",
                 "status": f"error: {str(e)}",
                 "transcription_time": ""
             }
+    
+    def _streaming_requests(self, audio_file: str) -> Iterator[cloud_speech.StreamingRecognizeRequest]:
+        """
+        Generate the streaming request sequence for an audio file.
+        
+        The first request carries the recognizer and configuration; each
+        following request carries one chunk of audio read from disk.
+        
+        Args:
+            audio_file: Path to the audio file
+            
+        Yields:
+            StreamingRecognizeRequest messages
+        """
+        yield cloud_speech.StreamingRecognizeRequest(
+            recognizer=self.recognizer,
+            streaming_config=cloud_speech.StreamingRecognitionConfig(
+                config=self._recognition_config()
+            ),
+        )
+        
+        with open(audio_file, "rb") as f:
+            for chunk in iter(lambda: f.read(self.STREAM_CHUNK_BYTES), b""):
+                yield cloud_speech.StreamingRecognizeRequest(audio=chunk)
+    
+    def _windowed_streaming_requests(
+        self,
+        audio_file: str
+    ) -> Iterator[Iterator[cloud_speech.StreamingRecognizeRequest]]:
+        """
+        Generate one streaming request sequence per window of a PCM WAV file.
+        
+        Each window is a separate streaming session with an explicit LINEAR16
+        decoding config, since only the first window carries the WAV header.
+        Each sequence must be consumed before the next one is requested.
+        
+        Args:
+            audio_file: Path to a 16-bit PCM WAV file
+            
+        Yields:
+            StreamingRecognizeRequest iterators, one per session
+            
+        Raises:
+            ValueError: If the file is not 16-bit PCM WAV
+        """
+        try:
+            wav_file = wave.open(audio_file, 'rb')
+        except (wave.Error, EOFError):
+            raise ValueError(
+                f"audio longer than {self.STREAM_MAX_SECONDS} seconds must be 16-bit PCM WAV "
+                f"or be transcribed with BatchRecognize (set GOOGLE_GCS_BUCKET)"
+            )
+        
+        with wav_file:
+            if wav_file.getsampwidth() != 2:
+                raise ValueError("windowed streaming requires 16-bit PCM WAV")
+            
+            streaming_config = cloud_speech.StreamingRecognitionConfig(
+                config=cloud_speech.RecognitionConfig(
+                    explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
+                        encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
+                        sample_rate_hertz=wav_file.getframerate(),
+                        audio_channel_count=wav_file.getnchannels(),
+                    ),
+                    language_codes=[self.language],
+                    model=self.model,
+                )
+            )
+            frame_bytes = wav_file.getsampwidth() * wav_file.getnchannels()
+            # Whole frames only, rounded down so no chunk exceeds STREAM_CHUNK_BYTES
+            chunk_frames = self.STREAM_CHUNK_BYTES // frame_bytes
+            window_frames = int(self.STREAM_WINDOW_SECONDS * wav_file.getframerate())
+            
+            def window_requests():
+                yield cloud_speech.StreamingRecognizeRequest(
+                    recognizer=self.recognizer,
+                    streaming_config=streaming_config,
+                )
+                remaining = window_frames
+                while remaining > 0:
+                    chunk = wav_file.readframes(min(chunk_frames, remaining))
+                    if not chunk:
+                        return
+                    remaining -= len(chunk) // frame_bytes
+                    yield cloud_speech.StreamingRecognizeRequest(audio=chunk)
+            
+            for _ in range(0, wav_file.getnframes(), window_frames):
+                yield window_requests()
+    
+    def transcribe_batch(self, audio_files: List[str]) -> List[Dict[str, str]]:
+        """
+        Transcribe several audio files with one BatchRecognize operation.
+        
+        The files are uploaded to the staging bucket under per-index names (so
+        files with the same name from different directories get distinct
+        URIs), recognized in a single long-running operation with inline
+        results, and deleted afterwards.
+        The reported transcription_time is the duration of the whole operation.
+        
+        Args:
+            audio_files: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        if not self.gcs_bucket or len(audio_files) == 1:
+            return [self.transcribe_file(audio_file) for audio_file in audio_files]
+        
+        return self._batch_recognize(audio_files)
+    
+    def _batch_recognize(self, audio_files: List[str]) -> List[Dict[str, str]]:
+        """
+        Run one BatchRecognize operation over files staged in the bucket.
+        
+        Args:
+            audio_files: Paths to the audio files
+            
+        Returns:
+            List of result dictionaries, in the same order as the input
+        """
+        filenames = [os.path.basename(audio_file) for audio_file in audio_files]
+        prefix = f"audio/{uuid.uuid4().hex}"
+        blobs = []
+        
+        try:
+            # Stage audio in Cloud Storage
+            for i, (filename, audio_file) in enumerate(zip(filenames, audio_files)):
+                blob = self.bucket.blob(f"{prefix}/{i}-{filename}")
+                blob.upload_from_filename(audio_file)
+                blobs.append(blob)
+            
+            uris = [f"gs://{self.gcs_bucket}/{blob.name}" for blob in blobs]
+            
+            request = cloud_speech.BatchRecognizeRequest(
+                recognizer=self.recognizer,
+                config=self._recognition_config(),
+                files=[cloud_speech.BatchRecognizeFileMetadata(uri=uri) for uri in uris],
+                recognition_output_config=cloud_speech.RecognitionOutputConfig(
+                    inline_response_config=cloud_speech.InlineOutputConfig(),
+                ),
+            )
+            
+            print(f"Transcribing batch of {len(filenames)}: {filenames[0]} ... {filenames[-1]}")
+            
+            start_time = time.time()
+            operation = self.client.batch_recognize(request=request)
+            response = operation.result(timeout=self.batch_timeout)
+            transcription_time = time.time() - start_time
+            
+            print(f"✓ Google batch transcription time: {transcription_time:.1f}s")
+            
+            results = []
+            for filename, uri in zip(filenames, uris):
+                file_result = response.results.get(uri)
+                if file_result is None:
+                    status = "error: missing from batch response"
+                elif file_result.error.code:
+                    status = f"error: {file_result.error.message}"
+                else:
+                    transcript = ""
+                    for result in file_result.inline_result.transcript.results:
+                        if result.alternatives:
+                            transcript += result.alternatives[0].transcript + " "
+                    
+                    results.append({
+                        "filename": filename,
+                        "text": transcript.strip(),
+                        "status": "success",
+                        "transcription_time": f"{transcription_time:.2f}"
+                    })
+                    continue
+                
+                results.append({
+                    "filename": filename,
+                    "text": "",
+                    "status": status,
+                    "transcription_time": ""
+                })
+            
+            return results
+            
+        except Exception as e:
+            return [
+                {
+                    "filename": filename,
+                    "text": "",
+                    "status": f"error: {str(e)}",
+                    "transcription_time": ""
+                }
+                for filename in filenames
+            ]
+        finally:
+            for blob in blobs:
+                try:
+                    blob.delete()
+                except Exception:
+                    pass
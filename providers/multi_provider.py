@@ -0,0 +1,102 @@
+"""
+Multi-Provider Transcription
+Runs several speech-to-text providers over the same audio directory in one pass.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+from .base_provider import SpeechToTextProvider
+from .result_writer import CSVResultWriter, STANDARD_FIELDS, load_completed_keys
+
+
+def transcribe_directory_multi(
+    providers: Sequence[SpeechToTextProvider],
+    audio_dir: str,
+    output_csv: str,
+    supported_extensions: tuple = ('.wav', '.mp3', '.ogg', '.flac'),
+    concurrency: int = 1,
+    resume: bool = False,
+    recursive: bool = False,
+    pattern: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Transcribe all audio files in a directory with several providers at once.
+    
+    The directory is scanned (and the previous results read, when resuming)
+    only once. Each provider then runs in its own thread over the same file
+    list, so the total time is roughly that of the slowest provider, and
+    every result is written to a single CSV as one row per (file, provider).
+    
+    Args:
+        providers: Provider instances to run
+        audio_dir: Directory containing audio files
+        output_csv: Output CSV file path
+        supported_extensions: Tuple of supported audio file extensions
+        concurrency: Number of files each provider transcribes in parallel
+        resume: Skip files already transcribed successfully in output_csv
+    
+    Returns:
+        Dictionary mapping provider names to the number of rows written
+    
+    Raises:
+        RuntimeError: If any provider failed; raised once the other providers
+            have finished and their results have been written
+    """
+    audio_files = list(SpeechToTextProvider.find_audio_files(
+        audio_dir, supported_extensions, recursive, pattern
+    ))
+    
+    if not audio_files:
+        print(f"No audio files found in {audio_dir}")
+        return {}
+    
+    print(f"Found {len(audio_files)} audio files")
+    
+    completed = load_completed_keys(output_csv) if resume else set()
+    
+    # Provider-specific columns are appended after the standard ones
+    fieldnames: List[str] = list(STANDARD_FIELDS)
+    for stt in providers:
+        fieldnames.extend(f for f in stt._result_fieldnames() if f not in fieldnames)
+    
+    rows_written = {stt.provider_name: 0 for stt in providers}
+    progress_lock = threading.Lock()
+    
+    with CSVResultWriter(output_csv, fieldnames) as writer:
+        def run(stt: SpeechToTextProvider) -> None:
+            files = audio_files
+            if resume:
+                files = list(stt._filter_completed(audio_files, completed, audio_dir))
+                print(f"[{stt.provider_name}] Resuming: skipping {len(audio_files) - len(files)} "
+                      f"already transcribed files, {len(files)} remaining")
+            
+            for result in stt.transcribe_files(files, concurrency, audio_dir):
+                writer.write(result)
+                with progress_lock:
+                    rows_written[stt.provider_name] += 1
+                    print(f"[{stt.provider_name}] Processing {rows_written[stt.provider_name]} "
+                          f"of {len(files)}: {result['filename']}")
+        
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            futures = {stt.provider_name: executor.submit(run, stt) for stt in providers}
+            
+            failures = {}
+            for provider_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[{provider_name}] Error: {e}")
+                    failures[provider_name] = e
+    
+    if writer.appending:
+        print(f"\nResults appended to: {output_csv}")
+    else:
+        print(f"\nResults saved to: {output_csv}")
+    
+    if failures:
+        raise RuntimeError(
+            "; ".join(f"{provider_name} failed: {e}" for provider_name, e in failures.items())
+        )
+    
+    return rows_written
@@ -0,0 +1,158 @@
+"""
+Rate Limiter
+Token-bucket request pacing and exponential-backoff retries shared by all providers.
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# Markers of transient quota/availability errors in exception messages and
+# result status strings (HTTP 429/502/503/504, AWS throttling and limit
+# exceptions, gRPC RESOURCE_EXHAUSTED/UNAVAILABLE, ...)
+RETRYABLE_ERROR_PATTERN = re.compile(
+    r"\b(429|502|503|504)\b"
+    r"|throttl"
+    r"|resource[ _]?exhausted"
+    r"|too[ _]?many[ _]?requests"
+    r"|rate[ _]?exceeded"
+    r"|limit[ _]?exceeded"
+    r"|service[ _]?unavailable"
+    r"|\bunavailable\b",
+    re.IGNORECASE
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Tokens are added continuously at `rate` per second up to `capacity`;
+    each request takes one token and waits when the bucket is empty.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Request pacing plus retries with exponential backoff for transient errors.
+    
+    Usage:
+        limiter = RateLimiter(requests_per_second=5, max_retries=3)
+        response = limiter.call(client.get_transcription_job, TranscriptionJobName=name)
+    """
+    
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0
+    ):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            requests_per_second: Request quota; None or 0 disables pacing
+            max_retries: Retries after a transient error (default: 3)
+            base_delay: Backoff before the first retry, in seconds (default: 1.0)
+            max_delay: Maximum backoff between retries, in seconds (default: 30.0)
+        """
+        self.bucket = TokenBucket(requests_per_second) if requests_per_second else None
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, requests: int = 1) -> None:
+        """
+        Wait until the quota allows more requests.
+        
+        Args:
+            requests: Number of requests about to be made (default: 1)
+        """
+        if self.bucket is not None:
+            for _ in range(requests):
+                self.bucket.acquire()
+    
+    def backoff(self, attempt: int) -> None:
+        """
+        Sleep before a retry, using exponential backoff with jitter.
+        
+        Args:
+            attempt: Zero-based retry number
+        """
+        with self._lock:
+            self.retries += 1
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        time.sleep(random.uniform(delay / 2, delay))
+    
+    @staticmethod
+    def is_retryable_error(error: BaseException) -> bool:
+        """Check whether an exception looks like a transient quota or availability error."""
+        return bool(RETRYABLE_ERROR_PATTERN.search(f"{type(error).__name__}: {error}"))
+    
+    @staticmethod
+    def is_retryable_result(result: Dict[str, str]) -> bool:
+        """Check whether a failed transcription result was caused by a transient error."""
+        status = result.get('status', '')
+        return status != 'success' and bool(RETRYABLE_ERROR_PATTERN.search(status))
+    
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a function under the quota, retrying transient exceptions.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            The function's return value
+        
+        Raises:
+            The last exception if it is not transient or retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable_error(e):
+                    raise
+                self.backoff(attempt)
+                attempt += 1
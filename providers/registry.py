@@ -0,0 +1,135 @@
+"""
+Provider Registry
+Maps provider names to lazily imported provider and configuration classes.
+
+Built-in providers are registered below. Other packages can add providers
+without changing this repository by declaring an entry point in the
+`speech_to_text.providers` group, e.g. in their pyproject.toml:
+
+    [project.entry-points."speech_to_text.providers"]
+    whisper_local = "my_engines.whisper:WhisperProvider"
+
+The provider class is imported only when that provider is selected. It must
+subclass SpeechToTextProvider and set `config_class` to a class with
+`from_env()` and `validate()` methods, like the classes in config.py.
+"""
+
+import importlib
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Dict, List, Type
+
+
+# Entry point group scanned for third-party providers
+ENTRY_POINT_GROUP = "speech_to_text.providers"
+
+# Provider name -> {'provider': import path or class, 'config': import path, class or None}
+_registry: Dict[str, Dict[str, Any]] = {}
+_entry_points_loaded = False
+
+
+def register_provider(name: str, provider_class: Any, config_class: Any = None) -> None:
+    """
+    Register a provider under a name.
+    
+    Classes can be given directly or as 'module:ClassName' import paths,
+    which are only imported when the provider is used. Relative module
+    paths ('.azure_provider:AzureSpeechToText') resolve within this package.
+    
+    Args:
+        name: Provider name used on the command line
+        provider_class: SpeechToTextProvider subclass or its import path
+        config_class: Configuration class or its import path (default:
+            the provider class's `config_class` attribute)
+    """
+    _registry[name.lower()] = {'provider': provider_class, 'config': config_class}
+
+
+def available_providers() -> List[str]:
+    """Return the names of all registered providers, including entry points."""
+    _load_entry_points()
+    return list(_registry)
+
+
+def get_provider_class(name: str) -> Type:
+    """
+    Import and return the provider class registered under a name.
+    
+    Args:
+        name: Provider name
+    
+    Returns:
+        SpeechToTextProvider subclass
+    
+    Raises:
+        ValueError: If no provider is registered under the name
+    """
+    entry = _get_entry(name)
+    entry['provider'] = _resolve(entry['provider'])
+    return entry['provider']
+
+
+def get_config_class(name: str) -> Type:
+    """
+    Import and return the configuration class of a provider.
+    
+    Args:
+        name: Provider name
+    
+    Returns:
+        Configuration class with from_env() and validate()
+    
+    Raises:
+        ValueError: If the provider is unknown or has no configuration class
+    """
+    entry = _get_entry(name)
+    if entry['config'] is None:
+        entry['config'] = getattr(get_provider_class(name), 'config_class', None)
+        if entry['config'] is None:
+            raise ValueError(f"Provider '{name}' does not define a config_class")
+    
+    entry['config'] = _resolve(entry['config'])
+    return entry['config']
+
+
+def _get_entry(name: str) -> Dict[str, Any]:
+    """Look up a registry entry, loading entry points on a miss."""
+    name = name.lower()
+    if name not in _registry:
+        _load_entry_points()
+    if name not in _registry:
+        raise ValueError(
+            f"Unknown provider: {name}. "
+            f"Supported providers: {', '.join(available_providers())}"
+        )
+    return _registry[name]
+
+
+def _resolve(target: Any) -> Any:
+    """Import a 'module:attribute' path; anything else is returned unchanged."""
+    if isinstance(target, EntryPoint):
+        return target.load()
+    if not isinstance(target, str):
+        return target
+    
+    module_name, _, attribute = target.partition(':')
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, attribute)
+
+
+def _load_entry_points() -> None:
+    """Register providers declared by installed packages (once, without importing them)."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        # Built-in registrations take precedence over plugins with the same name
+        if entry_point.name.lower() not in _registry:
+            register_provider(entry_point.name, entry_point)
+
+
+register_provider("azure", ".azure_provider:AzureSpeechToText", "config:AzureConfig")
+register_provider("amazon", ".amazon_provider:AmazonTranscribe", "config:AmazonConfig")
+register_provider("google", ".google_provider:GoogleSpeechToText", "config:GoogleConfig")
+register_provider("custom_service", ".custom_provider:CustomServiceProvider", "config:CustomServiceConfig")
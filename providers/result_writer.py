@@ -0,0 +1,152 @@
+"""
+Streaming CSV Result Writer
+Appends transcription results to a CSV file one row at a time.
+"""
+
+import csv
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+
+# Standard columns written for every transcription result
+STANDARD_FIELDS = [
+    'filename', 'person', 'audio', 'noise', 'snr',
+    'provider', 'language', 'text', 'status', 'transcription_time'
+]
+
+
+def load_completed_keys(output_file: str) -> Set[Tuple[str, str, str]]:
+    """
+    Build the set of (filename, provider, language) keys already transcribed
+    successfully in an existing results CSV.
+    
+    The file is read in a single pass with a plain csv.reader. Rows written
+    before the language column existed are indexed with an empty language.
+    
+    Args:
+        output_file: Results CSV file path
+    
+    Returns:
+        Set of (filename, provider, language) tuples with a success status
+    """
+    completed = set()
+    
+    if not os.path.exists(output_file):
+        return completed
+    
+    with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header or not {'filename', 'provider', 'status'} <= set(header):
+            return completed
+        
+        filename_idx = header.index('filename')
+        provider_idx = header.index('provider')
+        status_idx = header.index('status')
+        language_idx = header.index('language') if 'language' in header else None
+        min_length = max(filename_idx, provider_idx, status_idx, language_idx or 0) + 1
+        
+        for row in reader:
+            if len(row) < min_length or row[status_idx] != 'success':
+                continue
+            language = row[language_idx] if language_idx is not None else ''
+            completed.add((row[filename_idx], row[provider_idx], language))
+    
+    return completed
+
+
+class CSVResultWriter:
+    """
+    Incremental CSV sink for transcription results.
+    
+    The header is fixed when the writer is opened, and every row is flushed
+    to disk as soon as it is written, so an interrupted run keeps all the
+    results produced so far and memory does not grow with the corpus.
+    Writes are serialized with a lock, so several providers can share one
+    writer from different threads.
+    
+    Usage:
+        with CSVResultWriter('results.csv') as writer:
+            writer.write(result)
+    """
+    
+    def __init__(self, output_file: str, fieldnames: Optional[Sequence[str]] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            output_file: Output CSV file path
+            fieldnames: Columns to write (default: STANDARD_FIELDS)
+        """
+        self.output_file = output_file
+        self.fieldnames: List[str] = list(fieldnames or STANDARD_FIELDS)
+        self.appending = False
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+    
+    def open(self) -> 'CSVResultWriter':
+        """
+        Open the output file, appending if it already has content.
+        
+        When appending, only the header line of the existing file is read so
+        that new rows line up with its columns.
+        """
+        self.appending = os.path.exists(self.output_file) and os.path.getsize(self.output_file) > 0
+        
+        if self.appending:
+            existing_fieldnames = self._read_header()
+            if existing_fieldnames:
+                missing = [f for f in self.fieldnames if f not in existing_fieldnames]
+                if missing:
+                    print(f"Warning: {self.output_file} has no column for {', '.join(missing)}; "
+                          f"these values will not be written")
+                self.fieldnames = existing_fieldnames
+            else:
+                self.appending = False
+        
+        mode = 'a' if self.appending else 'w'
+        self._file = open(self.output_file, mode, newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        
+        # Only write header if creating a new file
+        if not self.appending:
+            self._writer.writeheader()
+            self._file.flush()
+        
+        return self
+    
+    def write(self, result: Dict[str, str]) -> None:
+        """
+        Write a single result row and flush it to disk.
+        
+        Args:
+            result: Transcription result dictionary
+        """
+        with self._lock:
+            self._writer.writerow(result)
+            self._file.flush()
+            self.rows_written += 1
+    
+    def close(self) -> None:
+        """Close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+    
+    def _read_header(self) -> Optional[List[str]]:
+        """Read only the header row of the existing output file."""
+        try:
+            with open(self.output_file, 'r', newline='', encoding='utf-8') as csvfile:
+                return next(csv.reader(csvfile), None)
+        except (IOError, csv.Error):
+            return None
+    
+    def __enter__(self) -> 'CSVResultWriter':
+        return self.open()
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
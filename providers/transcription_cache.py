@@ -0,0 +1,187 @@
+"""
+Transcription Cache
+Content-addressed on-disk cache of transcription results backed by SQLite.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TranscriptionCache:
+    """
+    Caches successful transcriptions keyed on audio content and provider settings.
+    
+    The key is a SHA-256 of the audio bytes combined with the provider name,
+    language and provider-specific settings (model, timeouts, ...), so identical
+    audio is only sent once per configuration no matter its filename. The cache
+    is bounded to `max_entries`; the least recently used entries are evicted.
+    """
+    
+    def __init__(self, db_path: str, max_entries: int = 100000):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            max_entries: Maximum number of cached transcriptions
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcriptions ("
+            "  key TEXT PRIMARY KEY,"
+            "  text TEXT NOT NULL,"
+            "  status TEXT NOT NULL,"
+            "  transcription_time TEXT NOT NULL,"
+            "  last_used REAL NOT NULL,"
+            "  segments TEXT"
+            ")"
+        )
+        # Databases created before segments were cached lack the column
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(transcriptions)")]
+        if 'segments' not in columns:
+            self._conn.execute("ALTER TABLE transcriptions ADD COLUMN segments TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_transcriptions_last_used "
+            "ON transcriptions (last_used)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0]
+    
+    @staticmethod
+    def make_key(
+        audio_file_path: str,
+        provider: str,
+        language: str,
+        settings: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Build the cache key for an audio file and provider configuration.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            provider: Provider name
+            language: Recognition language
+            settings: Provider-specific settings that affect the transcription
+        
+        Returns:
+            Hex digest identifying the audio content and configuration
+        """
+        audio_hash = hashlib.sha256()
+        with open(audio_file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                audio_hash.update(chunk)
+        
+        config = json.dumps([provider, language, settings or {}], sort_keys=True)
+        return hashlib.sha256(f"{audio_hash.hexdigest()}:{config}".encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a cached transcription and update hit/miss counters.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Dictionary with text, status, transcription_time (and segments
+            when the result had them), or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, status, transcription_time, segments FROM transcriptions WHERE key = ?",
+                (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE transcriptions SET last_used = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            
+            text, status, transcription_time, segments = row
+            try:
+                self.saved_seconds += float(transcription_time)
+            except ValueError:
+                pass
+        
+        result = {
+            "text": text,
+            "status": status,
+            "transcription_time": transcription_time
+        }
+        if segments is not None:
+            result["segments"] = segments
+        return result
+    
+    def put(self, key: str, result: Dict[str, str]) -> None:
+        """
+        Store a transcription result, evicting old entries if the cache is full.
+        
+        Args:
+            key: Cache key from make_key
+            result: Transcription result dictionary
+        """
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM transcriptions WHERE key = ?", (key,)
+            ).fetchone() is not None
+            
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcriptions "
+                "(key, text, status, transcription_time, last_used, segments) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    result.get('text', ''),
+                    result.get('status', ''),
+                    result.get('transcription_time', ''),
+                    time.time(),
+                    result.get('segments')
+                )
+            )
+            if not exists:
+                self._count += 1
+            
+            if self._count > self.max_entries:
+                excess = self._count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM transcriptions WHERE key IN ("
+                    "  SELECT key FROM transcriptions ORDER BY last_used LIMIT ?"
+                    ")",
+                    (excess,)
+                )
+                self._count -= excess
+                self.evictions += excess
+            
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss/eviction counters and estimated provider time saved."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self._count,
+            "saved_seconds": self.saved_seconds
+        }
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
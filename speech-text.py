@@ -5,8 +5,8 @@ Results are saved to a CSV file.
 """
 
 import typer
-from providers import ProviderFactory
-from config import ProviderConfig, AzureConfig, AmazonConfig, GoogleConfig, CustomServiceConfig
+from providers import ProviderFactory, TranscriptionCache, get_config_class, transcribe_directory_multi
+from config import ProviderConfig
 
 app = typer.Typer()
 
@@ -35,7 +35,44 @@ def main(
         "azure",
         "--provider",
         "-p",
-        help="Speech-to-text provider (azure, amazon, google, custom_service)"
+        help="Speech-to-text provider (azure, amazon, google, custom_service or a plugin); "
+             "comma-separate several to run them concurrently into one CSV"
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of files to transcribe in parallel"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        "-r",
+        help="Skip files already transcribed successfully in the output CSV"
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-R",
+        help="Also transcribe audio files in subdirectories"
+    ),
+    pattern: str = typer.Option(
+        None,
+        "--pattern",
+        "-g",
+        help="Only transcribe files whose path relative to the audio directory matches this glob"
+    ),
+    cache_path: str = typer.Option(
+        None,
+        "--cache",
+        help="SQLite transcription cache file; identical audio is not sent twice"
+    ),
+    cache_max_entries: int = typer.Option(
+        None,
+        "--cache-max-entries",
+        min=1,
+        help="Maximum number of cached transcriptions before eviction"
     )
 ):
     """
@@ -47,58 +84,94 @@ def main(
     - google: Requires GOOGLE_CLOUD_PROJECT (optional: GOOGLE_APPLICATION_CREDENTIALS for JSON auth)
     - custom_service: Requires CUSTOM_SERVICE_URI (default: http://0.0.0.0:8000)
     """
-    provider = provider.lower()
+    provider_names = [name.strip().lower() for name in provider.split(',') if name.strip()]
+    if not provider_names:
+        typer.secho("Error: No provider given", fg=typer.colors.RED, bold=True)
+        raise typer.Exit(1)
     
     # Get common settings
     common_settings = ProviderConfig.get_common_settings(language)
     audio_directory = audio_dir or common_settings['audio_dir']
     output_file = output_csv or common_settings['output_csv']
     lang = common_settings['language']
+    cache_file = cache_path or common_settings['cache_path']
     
     # Validate and get provider configuration
-    config_classes = {
-        "azure": AzureConfig,
-        "amazon": AmazonConfig,
-        "google": GoogleConfig,
-        "custom_service": CustomServiceConfig
-    }
-    
-    if provider not in config_classes:
-        typer.secho(
-            f"Error: Unknown provider '{provider}'. Use: azure, amazon, google, or custom_service",
-            fg=typer.colors.RED,
-            bold=True
-        )
-        raise typer.Exit(1)
-    
-    # Validate provider configuration
-    config_class = config_classes[provider]
-    is_valid, error_msg = config_class.validate()
-    if not is_valid:
-        typer.secho(f"Error: {error_msg}", fg=typer.colors.RED, bold=True)
-        raise typer.Exit(1)
-    
-    # Get configuration
-    config = config_class.from_env()
+    configs = {}
+    for provider in provider_names:
+        try:
+            config_class = get_config_class(provider)
+        except ValueError as e:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED, bold=True)
+            raise typer.Exit(1)
+        
+        # Validate provider configuration
+        is_valid, error_msg = config_class.validate()
+        if not is_valid:
+            typer.secho(f"Error: {error_msg}", fg=typer.colors.RED, bold=True)
+            raise typer.Exit(1)
+        
+        # Get configuration
+        configs[provider] = config_class.from_env()
     
     try:
-        # Create provider instance using factory
-        stt = ProviderFactory.create_provider(
-            provider=provider,
-            config=config,
-            language=lang
-        )
+        # One cache shared by all providers (keys include the provider name)
+        cache = None
+        if cache_file:
+            cache = TranscriptionCache(
+                cache_file,
+                max_entries=cache_max_entries or common_settings['cache_max_entries']
+            )
+        
+        # Create provider instances using factory
+        providers = []
+        for provider, config in configs.items():
+            stt = ProviderFactory.create_provider(
+                provider=provider,
+                config=config,
+                language=lang
+            )
+            stt.set_rate_limit(
+                requests_per_second=config.get('requests_per_second'),
+                max_retries=common_settings['max_retries']
+            )
+            stt.cache = cache
+            providers.append(stt)
         
         typer.secho(
-            f"Using provider: {provider.upper()}",
+            f"Using provider: {', '.join(name.upper() for name in configs)}",
             fg=typer.colors.BLUE,
             bold=True
         )
         
-        stt.transcribe_directory(
-            audio_dir=audio_directory,
-            output_csv=output_file
-        )
+        if len(providers) == 1:
+            providers[0].transcribe_directory(
+                audio_dir=audio_directory,
+                output_csv=output_file,
+                concurrency=concurrency,
+                resume=resume,
+                recursive=recursive,
+                pattern=pattern
+            )
+        else:
+            # Scan once and run all providers concurrently into one CSV
+            transcribe_directory_multi(
+                providers,
+                audio_dir=audio_directory,
+                output_csv=output_file,
+                concurrency=concurrency,
+                resume=resume,
+                recursive=recursive,
+                pattern=pattern
+            )
+        
+        if cache is not None:
+            stats = cache.stats()
+            typer.echo(
+                f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions, ~{stats['saved_seconds']:.1f}s of provider time saved"
+            )
+            cache.close()
         
         typer.secho(
             f"\n✓ Transcription complete!",